@@ -1,11 +1,31 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import os
+from datetime import timedelta
+
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 import joblib
-import pandas as pd
+import numpy as np
 
 from utils.feature_engineering import prepare_features
 from utils.shap_utils import RFShapExplainer
-from utils.aqi_utils import calculate_aqi_pm25, aqi_category
+from utils.aqi_utils import calculate_aqi_pm25, calculate_aqi_pm25_array, aqi_category
+from utils.inference_executor import InferenceExecutor, MicroBatcher, ExecutorSaturated
+from utils.stations import load_station_catalog
+from utils.dtypes import read_csv
+from utils.validation import VALIDATED_COLS
+from utils.monitoring import PredictionMonitor, to_local
+from utils.streaming_features import StreamingFeatureEngine
+from utils.uncertainty import IntervalEstimator
+from utils.serialization import Encoded, ResponseCache, encode
+from utils.scenarios import (
+    PartialDependenceCache, parse_grids, n_variants, response_surface
+)
+from utils.interpolation import (
+    BENGALURU_BBOX, interpolate_grid, aqi_grid, aqi_to_rgba, encode_png
+)
 
 # ========================
 # LOAD MODELS
@@ -16,16 +36,159 @@ xgb_model = joblib.load("models/pm25_xgb_model.pkl")
 ensemble_cfg = joblib.load("models/ensemble_config.pkl")
 feature_columns = joblib.load("models/feature_columns.pkl")
 
+# The notebooks fit both models with n_jobs=-1. Concurrency comes from the
+# bounded inference executor, so each predict stays on its worker thread
+# instead of spawning a pool per call (≈ cores² threads under load)
+rf_model.n_jobs = 1
+xgb_model.set_params(n_jobs=1)
+
 w_rf = ensemble_cfg["weights"]["random_forest"]
 w_xgb = ensemble_cfg["weights"]["xgboost"]
 
+
+def _ensemble_predict(X):
+    """
+    Weighted RF + XGBoost prediction for every row of X
+    """
+    pm25_rf = rf_model.predict(X)
+    pm25_xgb = xgb_model.predict(X)
+    return w_rf * pm25_rf + w_xgb * pm25_xgb
+
+
+# p10/p50/p90 bands: calibration table built by calibrate_intervals.py
+INTERVAL_CALIBRATION_PATH = "models/interval_calibration.pkl"
+interval_estimator = (
+    IntervalEstimator(rf_model, joblib.load(INTERVAL_CALIBRATION_PATH))
+    if os.path.exists(INTERVAL_CALIBRATION_PATH) else None
+)
+
+
+# Training data: SHAP background, drift reference, partial-dependence samples
+training_df = read_csv("../data/ml_ready_dataset_clean.csv", dayfirst=True)
+training_features = training_df.drop(columns=["from_date", "station_id", "PM2.5"])
+
 # Background data for SHAP
-background_df = pd.read_csv(
-    "../data/ml_ready_dataset_clean.csv"
-).drop(columns=["from_date", "station_id", "PM2.5"]).sample(100)
+background_df = training_features.sample(100)
 
 shap_explainer = RFShapExplainer(rf_model, background_df)
 
+# Online accuracy + feature drift monitoring
+monitor = PredictionMonitor(training_features, stations=load_station_catalog().ids())
+
+# PM2.5 lags per station, updated as readings arrive (same code as src/03)
+feature_engine = StreamingFeatureEngine()
+
+# What-if partial-dependence curves, computed once per station on first use
+pd_cache = PartialDependenceCache(_ensemble_predict, training_df, feature_columns)
+
+# Path relative to backend/ directory
+LIVE_DATA_PATH = os.getenv("LIVE_DATA_PATH", "../frontend/data/live_data.csv")
+
+
+def load_live_data():
+    """
+    Reads the live log. Readings are range/spike/stuck-checked and imputed
+    at write time by data_updater/fetch.py, so values are used as-is; only
+    a log written before validation existed (no qc_flags column) is
+    NaN-filled here, once and vectorised.
+    """
+    df = read_csv(LIVE_DATA_PATH, parse_dates=["datetime"])
+    if "qc_flags" not in df.columns:
+        cols = df.columns.intersection(VALIDATED_COLS)
+        df[cols] = df[cols].fillna(0.0)
+
+    # Realized PM2.5 settles any predictions waiting for it
+    monitor.observe_readings(df)
+    feature_engine.observe(df)
+    return df
+
+
+# Live predictions are for the hour after the latest reading: calendar
+# features and lags both describe that hour, like one offline row
+FORECAST_STEP = timedelta(hours=1)
+
+
+def lag_inputs(station, current_pm25):
+    """
+    Lags for the hour after a station's latest reading (use with the
+    reading's datetime + FORECAST_STEP), from the streaming feature engine.
+    Hours missing from the log fall back to the latest PM2.5, the nearest
+    value the offline ffill/bfill would use.
+    """
+    lags = feature_engine.next_lags(station) or dict.fromkeys(feature_engine.columns)
+    return {
+        col: current_pm25 if value is None or np.isnan(value) else value
+        for col, value in lags.items()
+    }
+
+
+def live_data_version():
+    """
+    Changes whenever fetch.py rewrites the live log; None if it is missing
+    """
+    try:
+        stat = os.stat(LIVE_DATA_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# ========================
+# RESPONSE CACHE
+# ========================
+# Predictions and their serialised/compressed bytes are reused until the
+# live log changes, so repeat dashboard loads are mostly a memory copy.
+response_cache = ResponseCache()
+_comparison_cache = {}
+
+
+async def cached_response(request, key, build, *args):
+    """
+    Serves pre-encoded bytes for `key` when the live log is unchanged;
+    otherwise runs `build(*args)` in the executor, encodes the payload for
+    this client's Accept / Accept-Encoding, and caches it.
+    """
+    accept = request.headers.get("accept")
+    accept_encoding = request.headers.get("accept-encoding")
+    version = live_data_version()
+
+    encoded = None
+    if version is not None:
+        encoded = response_cache.get(key, version, accept, accept_encoding)
+    if encoded is None:
+        encoded = await inference.run(
+            _build_encoded, key, version, accept, accept_encoding, build, *args
+        )
+
+    return Response(encoded.body, media_type=encoded.media_type, headers=encoded.headers)
+
+
+def _build_encoded(key, version, accept, accept_encoding, build, *args):
+    payload = build(*args)
+    # Builders may return ready-made bytes (e.g. /grid's PNG / float32 body)
+    encoded = payload if isinstance(payload, Encoded) else encode(payload, accept, accept_encoding)
+
+    if version is not None and not (isinstance(payload, dict) and "error" in payload):
+        response_cache.put(key, version, accept, accept_encoding, encoded)
+    return encoded
+
+
+# ========================
+# INFERENCE EXECUTOR
+# ========================
+# CPU-heavy work runs here instead of FastAPI's shared threadpool.
+# When the queue is full, requests are shed with 503 + Retry-After.
+inference = InferenceExecutor(
+    max_workers=int(os.getenv("INFERENCE_WORKERS", 0)) or None,
+    max_queue=int(os.environ["INFERENCE_QUEUE"]) if "INFERENCE_QUEUE" in os.environ else None,
+    retry_after=int(os.getenv("INFERENCE_RETRY_AFTER", 1)),
+)
+
+# ========================
+# STATION CATALOG
+# ========================
+station_catalog = load_station_catalog()
+
 # ========================
 # FASTAPI APP
 # ========================
@@ -42,6 +205,39 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturated):
+    return JSONResponse(
+        status_code=503,
+        content={"error": "Server busy, retry shortly"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+logger = logging.getLogger("pm25.api")
+
+# Set PD_WARMUP=0 to skip it (e.g. benchmarks, which time endpoints from startup)
+PD_WARMUP = os.getenv("PD_WARMUP", "1") != "0"
+
+
+def _log_warmup_failure(task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Partial-dependence warm-up failed", exc_info=task.exception())
+
+
+@app.on_event("startup")
+async def warm_partial_dependence():
+    # Precomputes every station's curves in the background, off the request path
+    if PD_WARMUP:
+        app.state.pd_warmup = asyncio.create_task(inference.run(pd_cache.warm))
+        app.state.pd_warmup.add_done_callback(_log_warmup_failure)
+
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    inference.shutdown()
+
+
 # ========================
 # ROOT ENDPOINT
 # ========================
@@ -50,15 +246,46 @@ def home():
     return {"message": "PM2.5 Ensemble Prediction API is running"}
 
 
+# ========================
+# MONITORING ENDPOINT
+# ========================
+@app.get("/monitoring")
+def monitoring():
+    """
+    Per-station streaming error stats (predictions vs PM2.5 one hour later),
+    feature drift vs training data (PSI), and active alerts
+    """
+    return monitor.report()
+
+
+# ========================
+# STATIONS ENDPOINT
+# ========================
+@app.get("/stations")
+def list_stations(lat: float = None, lon: float = None, k: int = 1):
+    """
+    Station catalog. With lat/lon, returns the k nearest stations instead.
+    """
+    if (lat is None) != (lon is None):
+        return {"error": "lat and lon must be given together"}
+    if k < 1:
+        return {"error": "k must be at least 1"}
+    if lat is not None:
+        return station_catalog.nearest(lat, lon, k)
+    return station_catalog.stations
+
+
 # ========================
 # LIVE DATA ENDPOINT
 # ========================
 @app.get("/latest")
-def get_latest(station_id: str = None):
+async def get_latest(station_id: str = None):
+    return await inference.run(_latest_reading, station_id)
+
+
+def _latest_reading(station_id):
     try:
-        # Path relative to backend/ directory
-        csv_path = "../frontend/data/live_data.csv"
-        df = pd.read_csv(csv_path, parse_dates=["datetime"])
+        df = load_live_data()
         
         if df.empty:
             return {"error": "No data available"}
@@ -77,16 +304,16 @@ def get_latest(station_id: str = None):
 
         return {
             "datetime": str(latest["datetime"]),
+            # Pass this (not datetime) to /predict along with the lags
+            "forecast_datetime": str(latest["datetime"] + FORECAST_STEP),
             "PM10": float(latest["PM10"]),
             "NO2": float(latest["NO2"]),
-            "NOx": float(latest["NOx"]) if pd.notna(latest.get("NOx")) else 0.0,
+            "NOx": float(latest["NOx"]),
             "CO": float(latest["CO"]),
-            "Ozone": float(latest["Ozone"]) if pd.notna(latest.get("Ozone")) else 0.0,
-            "RH": float(latest["RH"]) if pd.notna(latest.get("RH")) else 0.0,
+            "Ozone": float(latest["Ozone"]),
+            "RH": float(latest["RH"]),
             "station_id": latest.get("station_id", "Unknown"),
-            "PM25_lag_1": float(latest["PM2.5"]) if pd.notna(latest.get("PM2.5")) else 0.0,
-            # For lag_24 we might need more logic or just approximate with current/lag_1
-            "PM25_lag_24": float(latest["PM2.5"]) if pd.notna(latest.get("PM2.5")) else 0.0
+            **lag_inputs(latest.get("station_id"), float(latest["PM2.5"])),
         }
     except Exception as e:
         return {"error": str(e)}
@@ -100,75 +327,306 @@ def get_latest(station_id: str = None):
 # COMPARISON ENDPOINT
 # ========================
 @app.get("/comparison")
-def compare_stations():
+async def compare_stations(request: Request, intervals: bool = False):
+    return await cached_response(request, ("comparison", intervals), _compare_stations, intervals)
+
+
+def _compare_stations(intervals=False):
+    """
+    Latest reading + prediction per station, reused until the live log changes
+    """
+    version = live_data_version()
+    cached = _comparison_cache.get(intervals)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+
+    results = _compute_comparison(intervals)
+    if version is not None and isinstance(results, list):
+        _comparison_cache[intervals] = (version, results)
+    return results
+
+
+def _compute_comparison(intervals):
     try:
-        csv_path = "../frontend/data/live_data.csv"
-        df = pd.read_csv(csv_path, parse_dates=["datetime"])
+        df = load_live_data()
         
         if df.empty:
             return {"error": "No data available"}
 
-        stations = df["station_id"].dropna().unique()
-        results = []
-        
-        for station in stations:
-            latest = df[df["station_id"] == station].sort_values("datetime").iloc[-1]
-            
+        # One sort + groupby instead of a filter/sort per station, so the
+        # cost grows linearly with the log size, not stations × rows
+        latest_rows = (
+            df.dropna(subset=["station_id"])
+              .sort_values("datetime", kind="stable")
+              .groupby("station_id", sort=False, observed=True)
+              .tail(1)
+        )
+
+        inputs = []
+        for _, latest in latest_rows.iterrows():
             # Prepare input for prediction
-            input_data = {
-                "datetime": str(latest["datetime"]),
+            inputs.append({
+                "datetime": str(latest["datetime"] + FORECAST_STEP),
                 "PM10": float(latest["PM10"]),
                 "NO2": float(latest["NO2"]),
                 "NO": 0.0, # Default if missing
-                "NOx": float(latest["NOx"]) if pd.notna(latest.get("NOx")) else 0.0,
+                "NOx": float(latest["NOx"]),
                 "CO": float(latest["CO"]),
-                "Ozone": float(latest["Ozone"]) if pd.notna(latest.get("Ozone")) else 0.0,
-                "RH": float(latest["RH"]) if pd.notna(latest.get("RH")) else 0.0,
-                "PM25_lag_1": float(latest["PM2.5"]) if pd.notna(latest.get("PM2.5")) else 0.0,
-                "PM25_lag_24": float(latest["PM2.5"]) if pd.notna(latest.get("PM2.5")) else 0.0,
-            }
-            
-            # Predict
-            X = prepare_features(input_data, feature_columns)
-            pm25_rf = rf_model.predict(X)[0]
-            pm25_xgb = xgb_model.predict(X)[0]
-            pm25_final = w_rf * pm25_rf + w_xgb * pm25_xgb
-            
-            aqi = calculate_aqi_pm25(pm25_final)
-            
+                "Ozone": float(latest["Ozone"]),
+                "RH": float(latest["RH"]),
+                **lag_inputs(latest["station_id"], float(latest["PM2.5"])),
+            })
+
+        if not inputs:
+            return []
+
+        # Predict every station in one model call
+        X = prepare_features(inputs, feature_columns)
+        pm25_final = _ensemble_predict(X)
+
+        monitor.record_predictions(
+            latest_rows["station_id"], latest_rows["datetime"], pm25_final, inputs,
+            qc_flags=latest_rows["qc_flags"].tolist() if "qc_flags" in latest_rows else None
+        )
+
+        bands = _interval_rows(X, pm25_final) if intervals else [None] * len(inputs)
+
+        results = []
+        for (_, latest), pm25, band in zip(latest_rows.iterrows(), pm25_final, bands):
+            station = latest["station_id"]
+            aqi = calculate_aqi_pm25(pm25)
+            info = station_catalog.get(station) or {}
+
             results.append({
                 "name": station,
+                "lat": info.get("lat"),
+                "lon": info.get("lon"),
                 "PM10": float(latest["PM10"]),
-                "PM25": round(float(pm25_final), 2),
+                "PM25": round(float(pm25), 2),
                 "NO2": float(latest["NO2"]),
                 "CO": float(latest["CO"]),
                 "AQI": int(aqi)
             })
-            
+            if intervals:
+                results[-1]["PM25_interval"] = band
+
         return results
         
     except Exception as e:
         return {"error": str(e)}
 
 
-@app.post("/predict")
-def predict(data: dict):
+# ========================
+# GRID NOWCAST ENDPOINT
+# ========================
+GRID_MAX_SIDE = 512
+# Larger IDW powers underflow 1/d**p to 0 and leave cells empty
+GRID_MAX_POWER = 10.0
+
+
+@app.get("/grid")
+async def grid_nowcast(
+    request: Request,
+    variable: str = "pm25",
+    fmt: str = Query("json", alias="format"),
+    rows: int = 64,
+    cols: int = 64,
+    lat_min: float = BENGALURU_BBOX[0],
+    lon_min: float = BENGALURU_BBOX[1],
+    lat_max: float = BENGALURU_BBOX[2],
+    lon_max: float = BENGALURU_BBOX[3],
+    power: float = 2.0,
+):
+    """
+    City-wide PM2.5/AQI nowcast, interpolated (IDW) from the /comparison
+    station predictions. format: json | bin (float32, row-major, north row
+    first) | png (AQI colour map).
+    """
+    if variable not in ("pm25", "aqi"):
+        return {"error": "variable must be 'pm25' or 'aqi'"}
+    if fmt not in ("json", "bin", "png"):
+        return {"error": "format must be 'json', 'bin' or 'png'"}
+    if not (0 < rows <= GRID_MAX_SIDE and 0 < cols <= GRID_MAX_SIDE):
+        return {"error": f"rows and cols must be between 1 and {GRID_MAX_SIDE}"}
+    if not (lat_min < lat_max and lon_min < lon_max):
+        return {"error": "Invalid bounding box"}
+    if not 0 < power <= GRID_MAX_POWER:
+        return {"error": f"power must be in (0, {GRID_MAX_POWER}]"}
+
+    bbox = (lat_min, lon_min, lat_max, lon_max)
+    key = ("grid", variable, fmt, bbox, rows, cols, power)
+    return await cached_response(request, key, _grid_nowcast, variable, fmt, bbox, rows, cols, power)
 
-    X = prepare_features(data, feature_columns)
 
-    pm25_rf = rf_model.predict(X)[0]
-    pm25_xgb = xgb_model.predict(X)[0]
+def _grid_nowcast(variable, fmt, bbox, rows, cols, power):
+    stations = _compare_stations()
+    if isinstance(stations, dict):
+        return stations
 
-    pm25_final = w_rf * pm25_rf + w_xgb * pm25_xgb
+    located = [s for s in stations if s["lat"] is not None and s["lon"] is not None]
+    if not located:
+        return {"error": "No stations with known coordinates"}
 
-    aqi = calculate_aqi_pm25(pm25_final)
-    category = aqi_category(aqi)
+    coords = tuple((s["lat"], s["lon"]) for s in located)
+    pm25 = interpolate_grid(coords, [s["PM25"] for s in located], bbox, rows, cols, power)
+    grid = aqi_grid(pm25) if variable == "aqi" else pm25
 
-    explanation = shap_explainer.explain(X)
+    headers = {
+        "X-Grid-Rows": str(rows),
+        "X-Grid-Cols": str(cols),
+        "X-Grid-BBox": ",".join(str(v) for v in bbox),
+        "X-Grid-Variable": variable,
+    }
+
+    if fmt == "bin":
+        return Encoded(grid.astype("<f4").tobytes(), "application/octet-stream", headers)
+    if fmt == "png":
+        png = encode_png(aqi_to_rgba(grid if variable == "aqi" else aqi_grid(pm25)))
+        return Encoded(png, "image/png", headers)
 
     return {
-        "pm25_prediction": round(float(pm25_final), 2),
-        "aqi": int(aqi),
-        "aqi_category": category,
-        "explanation": explanation
+        "variable": variable,
+        "bbox": list(bbox),
+        "rows": rows,
+        "cols": cols,
+        "stations": [s["name"] for s in located],
+        # float32 → float64 first, or rounding leaves 23.020000457763672
+        "values": grid.astype(np.float64).round(2).tolist(),
     }
+
+
+# ========================
+# PREDICTION ENDPOINT
+# ========================
+def _interval_rows(X, point):
+    """
+    p10/p50/p90 per row, or None per row when no calibration table exists
+    """
+    if interval_estimator is None:
+        return [None] * len(point)
+    return interval_estimator.predict_rows(X, point)
+
+
+def _predict_batch(items):
+    """
+    Runs the ensemble and SHAP once for a list of (payload, intervals) items
+    """
+    payloads = [payload for payload, _ in items]
+    X = prepare_features(payloads, feature_columns)
+
+    pm25_final = _ensemble_predict(X)
+
+    # Only payloads that name a catalog station can be checked against reality.
+    # A payload's datetime is the hour being predicted (/latest's
+    # forecast_datetime), so the reading it came from is FORECAST_STEP earlier
+    monitor.record_predictions(
+        [p.get("station_id") for p in payloads],
+        [to_local(p["datetime"]) - FORECAST_STEP for p in payloads],
+        pm25_final,
+        payloads
+    )
+
+    explanations = shap_explainer.explain_batch(X)
+
+    wants_intervals = [intervals for _, intervals in items]
+    bands = _interval_rows(X, pm25_final) if any(wants_intervals) else [None] * len(items)
+
+    results = []
+    for pm25, explanation, intervals, band in zip(pm25_final, explanations, wants_intervals, bands):
+        aqi = calculate_aqi_pm25(pm25)
+        results.append({
+            "pm25_prediction": round(float(pm25), 2),
+            "aqi": int(aqi),
+            "aqi_category": aqi_category(aqi),
+            "explanation": explanation
+        })
+        if intervals:
+            results[-1]["pm25_interval"] = band
+
+    return results
+
+
+predict_batcher = MicroBatcher(
+    inference,
+    _predict_batch,
+    max_batch_size=int(os.getenv("PREDICT_MAX_BATCH", 32)),
+    max_wait=float(os.getenv("PREDICT_MAX_WAIT_MS", 5)) / 1000,
+)
+
+
+@app.post("/predict")
+async def predict(data: dict, intervals: bool = False):
+    # Rejected here so a bad payload never reaches (and fails) a batch
+    if "datetime" not in data:
+        return {"error": "datetime is required"}
+    return await predict_batcher.submit((data, intervals))
+
+
+# ========================
+# SCENARIO ENDPOINT
+# ========================
+SCENARIO_MAX_VARIANTS = int(os.getenv("SCENARIO_MAX_VARIANTS", 20000))
+
+
+@app.post("/scenarios")
+async def scenarios(data: dict):
+    """
+    What-if sweep around one reading. Body:
+        {"base": {<same fields as /predict>},
+         "grids": {"no2_pct": [-20, -10, 0], "is_festival": [0, 1], "hour": [8, 18]}}
+    Axes: pm10_pct / no2_pct / co_pct (percent change), is_festival /
+    is_secondary_event / is_local_event (0/1), hour (0-23). Every
+    combination is evaluated in one ensemble call; pm25 / aqi are nested
+    lists indexed in the order of `axes`.
+    """
+    base = data.get("base")
+    if not isinstance(base, dict) or "datetime" not in base:
+        return {"error": "base must be a reading with at least a datetime"}
+    try:
+        grids = parse_grids(data.get("grids") or {})
+    except ValueError as e:
+        return {"error": str(e)}
+    if n_variants(grids) > SCENARIO_MAX_VARIANTS:
+        return {"error": f"{n_variants(grids)} scenarios exceeds the limit of {SCENARIO_MAX_VARIANTS}"}
+
+    return await inference.run(_scenario_sweep, base, grids)
+
+
+def _scenario_sweep(base, grids):
+    try:
+        base_X = prepare_features(base, feature_columns)
+        pm25 = response_surface(_ensemble_predict, base_X, grids)
+        baseline = float(_ensemble_predict(base_X)[0])
+        if not (np.isfinite(pm25).all() and np.isfinite(baseline)):
+            return {"error": "base reading produced non-finite predictions"}
+
+        flat = pm25.ravel()
+        best = int(flat.argmin())
+        best_index = np.unravel_index(best, pm25.shape)
+
+        return {
+            "axes": {axis: values for axis, values in grids.items()},
+            "n_scenarios": int(flat.size),
+            "baseline": {"pm25": round(baseline, 2), "aqi": int(calculate_aqi_pm25_array(baseline))},
+            "pm25": pm25.round(2).tolist(),
+            "aqi": calculate_aqi_pm25_array(pm25).astype(int).tolist(),
+            "best": {
+                "scenario": {axis: grids[axis][i] for axis, i in zip(grids, best_index)},
+                "pm25": round(float(flat[best]), 2),
+            },
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@app.get("/scenarios/partial-dependence")
+async def partial_dependence(station_id: str):
+    """
+    Per-station partial-dependence curves over the scenario axes (mean
+    prediction over the station's recent training rows), cached after the
+    first request
+    """
+    if station_id not in pd_cache.samples:
+        return {"error": f"No training data for station {station_id}", "stations": pd_cache.stations}
+    curves = await inference.run(pd_cache.get, station_id)
+    return {"station_id": station_id, "curves": curves}
@@ -0,0 +1,97 @@
+"""
+Precomputes the conformal calibration table for p10/p50/p90 bands.
+
+Calibrates only on rows the training notebooks held out. The notebooks
+read from_date without dayfirst, so the dd-mm-yyyy strings stay text and
+the "time-ordered" 80/20 split is really a lexicographic one; that split
+is reproduced here exactly. The held-out rows are then put in real time
+order and cut in half: the first half calibrates, the second half
+reports empirical coverage.
+
+Run from backend/:
+    python calibrate_intervals.py
+"""
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from utils.dtypes import read_csv
+from utils.uncertainty import QUANTILES, tree_spread, conformal_offsets
+
+DATA_PATH = "../data/ml_ready_dataset_clean.csv"
+OUTPUT_PATH = "models/interval_calibration.pkl"
+
+# =========================
+# LOAD
+# =========================
+rf_model = joblib.load("models/pm25_rf_model.pkl")
+xgb_model = joblib.load("models/pm25_xgb_model.pkl")
+ensemble_cfg = joblib.load("models/ensemble_config.pkl")
+feature_columns = joblib.load("models/feature_columns.pkl")
+
+w_rf = ensemble_cfg["weights"]["random_forest"]
+w_xgb = ensemble_cfg["weights"]["xgboost"]
+
+df = read_csv(DATA_PATH, parse_dates=["from_date"], dayfirst=True)
+
+# =========================
+# HELD-OUT ROWS (exactly as the notebooks split)
+# =========================
+# Same read + sort as 02_baseline_model / 05_xgboost_model
+notebook_dates = pd.read_csv(DATA_PATH, parse_dates=["from_date"])["from_date"]
+split_idx = int(0.8 * len(notebook_dates))
+boundary = notebook_dates.sort_values().iloc[split_idx]
+
+# Rows tied with the boundary value may sit on either side of the split
+# (the sort is not stable), so only rows strictly after it are unseen
+unseen = (notebook_dates > boundary).to_numpy()
+held_out = df[unseen].sort_values("from_date", kind="stable")
+
+mid = len(held_out) // 2
+calib, evaluation = held_out.iloc[:mid], held_out.iloc[mid:]
+
+
+def ensemble_and_spread(part):
+    X = part[feature_columns]
+    point = w_rf * rf_model.predict(X) + w_xgb * xgb_model.predict(X)
+    return point, tree_spread(rf_model, X)
+
+
+# =========================
+# CALIBRATE
+# =========================
+point, spread = ensemble_and_spread(calib)
+offsets = conformal_offsets(calib["PM2.5"].to_numpy(), point, spread, QUANTILES)
+
+# =========================
+# EVALUATE ON THE OTHER HALF
+# =========================
+point_e, spread_e = ensemble_and_spread(evaluation)
+y_e = evaluation["PM2.5"].to_numpy()
+
+coverage = {
+    f"p{round(q * 100)}": float(np.mean(y_e <= point_e + k * spread_e))
+    for q, k in offsets.items()
+}
+lo, hi = min(offsets), max(offsets)
+band_coverage = float(np.mean(
+    (y_e >= point_e + offsets[lo] * spread_e) & (y_e <= point_e + offsets[hi] * spread_e)
+))
+
+calibration = {
+    "method": "normalised split-conformal on RF tree spread",
+    "offsets": offsets,
+    "n_calibration": len(calib),
+    "n_evaluation": len(evaluation),
+    "held_out": "rows after the notebooks' 80/20 split on unparsed from_date",
+    "coverage": coverage,
+    "band_coverage": band_coverage,
+}
+
+joblib.dump(calibration, OUTPUT_PATH)
+
+print("✅ Interval calibration saved →", OUTPUT_PATH)
+print("📐 Offsets (× tree spread):", {q: round(k, 3) for q, k in offsets.items()})
+print("🎯 Empirical P(y ≤ pq):", {k: round(v, 3) for k, v in coverage.items()})
+print(f"📊 p{round(lo * 100)}–p{round(hi * 100)} band coverage: {band_coverage:.3f}")
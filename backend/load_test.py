@@ -0,0 +1,103 @@
+"""
+Load-test harness for the PM2.5 API.
+
+Fires requests at increasing concurrency levels and reports throughput,
+latency percentiles and how many requests were shed with 503.
+
+Usage (backend must be running):
+    python load_test.py --url http://127.0.0.1:8000 --endpoint /predict \
+        --concurrency 1 2 4 8 16 32 --requests 200
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+SAMPLE_PAYLOAD = {
+    "datetime": "2025-11-14 09:00:00",
+    "PM10": 96.0,
+    "NO2": 22.5,
+    "NO": 0.0,
+    "NOx": 35.0,
+    "CO": 1.2,
+    "Ozone": 21.8,
+    "RH": 50.0,
+    "PM25_lag_1": 58.0,
+    "PM25_lag_24": 61.0,
+}
+
+
+def _one_request(session, method, url):
+    start = time.perf_counter()
+    try:
+        if method == "POST":
+            res = session.post(url, json=SAMPLE_PAYLOAD, timeout=60)
+        else:
+            res = session.get(url, timeout=60)
+        status = res.status_code
+    except requests.RequestException:
+        status = None
+    return status, time.perf_counter() - start
+
+
+def run_level(url, method, concurrency, total):
+    sessions = [requests.Session() for _ in range(concurrency)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(
+            lambda i: _one_request(sessions[i % concurrency], method, url),
+            range(total)
+        ))
+    elapsed = time.perf_counter() - start
+
+    ok = [lat for status, lat in results if status == 200]
+    shed = sum(1 for status, _ in results if status == 503)
+    failed = len(results) - len(ok) - shed
+
+    ok_sorted = sorted(ok)
+
+    def pct(p):
+        if not ok_sorted:
+            return float("nan")
+        return ok_sorted[min(len(ok_sorted) - 1, int(p * len(ok_sorted)))] * 1000
+
+    return {
+        "concurrency": concurrency,
+        "throughput_rps": len(ok) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(ok) * 1000 if ok else float("nan"),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "ok": len(ok),
+        "shed_503": shed,
+        "failed": failed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PM2.5 API load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoint", default="/predict")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level")
+    args = parser.parse_args()
+
+    url = args.url.rstrip("/") + args.endpoint
+    method = "POST" if args.endpoint.startswith("/predict") else "GET"
+
+    print(f"🎯 {method} {url}")
+    print(f"{'conc':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ok':>6} {'503':>6} {'err':>6}")
+
+    for concurrency in args.concurrency:
+        r = run_level(url, method, concurrency, args.requests)
+        print(
+            f"{r['concurrency']:>5} {r['throughput_rps']:>9.1f} {r['p50_ms']:>9.1f} "
+            f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['ok']:>6} {r['shed_503']:>6} {r['failed']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def calculate_aqi_pm25(pm25):
     breakpoints = [
         (0, 30, 0, 50),
@@ -30,3 +33,13 @@ def aqi_category(aqi):
         return "Very Poor"
     else:
         return "Severe"
+
+
+def calculate_aqi_pm25_array(pm25):
+    """
+    Vectorised AQI for an array of PM2.5 values (e.g. an interpolated grid).
+    Uses the same breakpoints; values above 500 are capped at AQI 500.
+    """
+    conc = [0, 30, 31, 60, 61, 90, 91, 120, 121, 250, 251, 500]
+    aqi = [0, 50, 51, 100, 101, 200, 201, 300, 301, 400, 401, 500]
+    return np.rint(np.interp(np.asarray(pm25, dtype=float), conc, aqi))
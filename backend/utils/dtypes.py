@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+# =========================
+# CENTRAL DTYPE SCHEMA
+# =========================
+# Readings and engineered lags: float32 (tree models use float32 internally)
+FLOAT_COLS = [
+    "PM2.5", "PM10", "NO", "NO2", "NOx", "NH3", "SO2", "CO", "Ozone",
+    "Benzene", "Toluene", "MP-Xylene", "O-Xylene",
+    "Temp", "Temp.1", "RH", "SR", "WS", "WD", "RF", "BP", "VWS", "AT",
+    "PM25_lag_1", "PM25_lag_6", "PM25_lag_24",
+]
+
+# Calendar fields and 0/1 flags all fit in int8
+INT8_COLS = [
+    "hour", "day_of_week", "month", "is_weekend", "is_winter", "is_early_month",
+    "is_festival", "is_secondary_event", "is_local_event",
+]
+
+CATEGORY_COLS = ["station_id", "month_name"]
+
+DATETIME_COLS = ["from_date", "to_date", "datetime"]
+
+DTYPE_SCHEMA = {
+    **{c: "float32" for c in FLOAT_COLS},
+    **{c: "int8" for c in INT8_COLS},
+    **{c: "category" for c in CATEGORY_COLS},
+    **{c: "datetime64[ns]" for c in DATETIME_COLS},
+}
+
+
+def apply_schema(df, dayfirst=False):
+    """
+    Casts every known column to its compact dtype, in place where possible.
+
+    int8 columns that still contain NaN (e.g. right after a reindex) are kept
+    as float32 until they are filled; unknown float64 columns are downcast
+    to float32.
+    """
+    for col in df.columns:
+        dtype = DTYPE_SCHEMA.get(col)
+
+        if dtype == "int8":
+            if df[col].isna().any():
+                df[col] = df[col].astype(np.float32)
+            else:
+                df[col] = df[col].astype(np.int8)
+        elif dtype == "category":
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+        elif dtype == "datetime64[ns]":
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], errors="coerce", dayfirst=dayfirst)
+        elif dtype == "float32" or df[col].dtype == np.float64:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(np.float32)
+
+    return df
+
+
+def read_csv(path, parse_dates=None, dayfirst=False, **kwargs):
+    """
+    pd.read_csv with the schema applied.
+
+    Float and categorical columns are typed by the parser itself so the
+    float64/object intermediates are never materialised.
+    """
+    header = pd.read_csv(path, nrows=0, **kwargs).columns
+    parser_dtypes = {
+        c: DTYPE_SCHEMA[c]
+        for c in header
+        if DTYPE_SCHEMA.get(c) in ("float32", "category")
+    }
+
+    df = pd.read_csv(
+        path,
+        dtype=parser_dtypes,
+        parse_dates=parse_dates,
+        dayfirst=dayfirst,
+        **kwargs
+    )
+    return apply_schema(df, dayfirst=dayfirst)
+
+
+def memory_mb(df):
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
@@ -1,25 +1,34 @@
 import pandas as pd
 
-def prepare_features(input_data: dict, feature_columns: list):
+from utils.streaming_features import TIME_COLS, LAG_COLS, time_features
+
+def prepare_features(input_data, feature_columns: list):
     """
-    Converts partial API input into FULL model-ready feature vector
+    Converts partial API input into FULL model-ready feature vector.
+    Accepts a single dict or a list of dicts (one row per dict).
     """
 
     # 1️⃣ Convert incoming JSON to DataFrame
-    df = pd.DataFrame([input_data])
+    rows = input_data if isinstance(input_data, list) else [input_data]
+    df = pd.DataFrame(rows)
+
+    # In a batch, a key missing from some payloads must still default to 0.0
+    if len(rows) > 1:
+        for col in df.columns.drop("datetime", errors="ignore"):
+            missing = [col not in row for row in rows]
+            if any(missing):
+                df.loc[missing, col] = 0.0
 
     # 2️⃣ Handle datetime
     df["datetime"] = pd.to_datetime(df["datetime"])
 
-    df["hour"] = df["datetime"].dt.hour
-    df["day_of_week"] = df["datetime"].dt.weekday
-    df["month"] = df["datetime"].dt.month
-    df["is_weekend"] = (df["day_of_week"] >= 5).astype(int)
+    # Same calendar features as the offline pipeline (incl. is_winter / is_early_month)
+    df[TIME_COLS] = time_features(df["datetime"])
 
     df = df.drop(columns=["datetime"])
 
-    # 3️⃣ Add missing LAG features (LIVE DATA CANNOT HAVE THESE)
-    for lag_col in ["PM25_lag_1", "PM25_lag_6", "PM25_lag_24"]:
+    # 3️⃣ Lags come from the caller (the backend's StreamingFeatureEngine); default if absent
+    for lag_col in LAG_COLS:
         if lag_col not in df.columns:
             df[lag_col] = 0.0
 
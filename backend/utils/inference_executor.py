@@ -0,0 +1,161 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ExecutorSaturated(Exception):
+    """
+    Raised when the inference queue is full and the request should be shed
+    """
+
+    def __init__(self, retry_after):
+        super().__init__("Inference queue is full")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for CPU-heavy work (model predict, SHAP, CSV parsing).
+
+    sklearn, XGBoost and SHAP release the GIL inside their native code, so a
+    thread pool sized to the cores keeps the models in shared memory without
+    pickling them into worker processes. At most `max_workers + max_queue`
+    jobs are admitted; anything beyond that is rejected immediately.
+    """
+
+    def __init__(self, max_workers=None, max_queue=None, retry_after=1):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = self.max_workers * 4 if max_queue is None else max_queue
+        self.retry_after = retry_after
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="inference"
+        )
+        # Only touched from the event loop thread, so no lock is needed
+        self._in_flight = 0
+
+    @property
+    def saturated(self):
+        return self._in_flight >= self.max_workers + self.max_queue
+
+    async def run(self, fn, *args, **kwargs):
+        if self.saturated:
+            raise ExecutorSaturated(self.retry_after)
+
+        loop = asyncio.get_running_loop()
+        job = self._pool.submit(functools.partial(fn, *args, **kwargs))
+        self._in_flight += 1
+
+        # Released when the job itself finishes, not when the caller stops
+        # waiting: a disconnected client's work still occupies a worker
+        job.add_done_callback(lambda _: self._release(loop))
+        return await asyncio.wrap_future(job)
+
+    def _release(self, loop):
+        # Called from a worker thread; the counter is only touched on the loop
+        try:
+            loop.call_soon_threadsafe(self._decrement)
+        except RuntimeError:
+            pass    # loop already closed at shutdown
+
+    def _decrement(self):
+        self._in_flight -= 1
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests for `max_wait` seconds (or until
+    `max_batch_size` items) and evaluates them with a single `batch_fn` call.
+
+    `batch_fn` takes a list of items and returns a list of results in the
+    same order.
+    """
+
+    def __init__(self, executor, batch_fn, max_batch_size=32, max_wait=0.005):
+        self.executor = executor
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def submit(self, item):
+        if self.executor.saturated:
+            raise ExecutorSaturated(self.executor.retry_after)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        items = [item for item, _ in batch]
+        try:
+            results = await self.executor.run(self.batch_fn, items)
+        except ExecutorSaturated as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                future = batch[0][1]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # One bad payload should not fail its neighbours: retry each item
+            # on its own, but as a single executor job so the retries do not
+            # compete with new requests for admission
+            try:
+                outcomes = await self.executor.run(self._run_each, items)
+            except Exception as e:
+                outcomes = [(False, e)] * len(batch)
+            for (_, future), (ok, value) in zip(batch, outcomes):
+                if not future.done():
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _run_each(self, items):
+        """
+        Runs batch_fn item by item (in the worker thread), returning
+        (ok, result or exception) per item
+        """
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append((True, self.batch_fn([item])[0]))
+            except Exception as e:
+                outcomes.append((False, e))
+        return outcomes
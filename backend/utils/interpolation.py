@@ -0,0 +1,161 @@
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from utils.aqi_utils import calculate_aqi_pm25_array
+
+# (lat_min, lon_min, lat_max, lon_max) covering BBMP limits
+BENGALURU_BBOX = (12.80, 77.40, 13.20, 77.80)
+
+KM_PER_DEG_LAT = 111.32
+
+# Weight matrices are (rows * cols) × n_stations float32; the cache is
+# bounded by total bytes, not entries, since grid size and station count
+# both come from outside
+WEIGHT_CACHE_BYTES = int(os.getenv("GRID_WEIGHT_CACHE_MB", 64)) * 2 ** 20
+BUILD_CHUNK_CELLS = 16384   # grid cells per float64 block while building
+
+# AQI band → RGB, same palette as the React AQI_CATEGORIES
+AQI_COLORS = [
+    (50, (16, 185, 129)),    # Good
+    (100, (132, 204, 22)),   # Satisfactory
+    (200, (234, 179, 8)),    # Moderate
+    (300, (249, 115, 22)),   # Poor
+    (400, (239, 68, 68)),    # Very Poor
+    (500, (124, 45, 18)),    # Severe
+]
+
+
+def grid_axes(bbox, rows, cols):
+    """
+    Cell-centre latitudes (north → south, image order) and longitudes
+    """
+    lat_min, lon_min, lat_max, lon_max = bbox
+    lat_step = (lat_max - lat_min) / rows
+    lon_step = (lon_max - lon_min) / cols
+    lats = lat_max - lat_step * (np.arange(rows) + 0.5)
+    lons = lon_min + lon_step * (np.arange(cols) + 0.5)
+    return lats, lons
+
+
+_weight_cache = OrderedDict()     # key → read-only float32 weights
+_weight_cache_bytes = 0
+_weight_cache_lock = threading.Lock()
+
+
+def _build_idw_weights(station_coords, bbox, rows, cols, power):
+    stations = np.asarray(station_coords, dtype=float)
+    lats, lons = grid_axes(bbox, rows, cols)
+    grid_lat, grid_lon = np.meshgrid(lats, lons, indexing="ij")
+    grid_lat, grid_lon = grid_lat.ravel(), grid_lon.ravel()
+
+    # Equirectangular distances are accurate to well under 1% at city scale
+    km_per_deg_lon = KM_PER_DEG_LAT * np.cos(np.radians(np.mean(bbox[0::2])))
+
+    weights = np.empty((rows * cols, len(stations)), dtype=np.float32)
+    # Built in blocks so the float64 temporaries stay small for big grids
+    for start in range(0, rows * cols, BUILD_CHUNK_CELLS):
+        block = slice(start, start + BUILD_CHUNK_CELLS)
+        dy = (grid_lat[block, None] - stations[:, 0]) * KM_PER_DEG_LAT
+        dx = (grid_lon[block, None] - stations[:, 1]) * km_per_deg_lon
+        dist = np.hypot(dx, dy)
+
+        with np.errstate(divide="ignore"):
+            w = 1.0 / dist ** power
+
+        # A cell centred exactly on a station takes that station's value
+        exact = dist == 0
+        hit_rows = exact.any(axis=1)
+        w[hit_rows] = exact[hit_rows]
+
+        weights[block] = w / w.sum(axis=1, keepdims=True)
+
+    weights.setflags(write=False)
+    return weights
+
+
+def idw_weights(station_coords, bbox=BENGALURU_BBOX, rows=64, cols=64, power=2.0):
+    """
+    Inverse-distance weight matrix of shape (rows * cols, n_stations).
+
+    Depends only on the station layout and grid, so it is built once and
+    cached (LRU, at most WEIGHT_CACHE_BYTES in total); each refresh is then
+    a single `weights @ station_values`. `station_coords` must be a
+    hashable tuple of (lat, lon) pairs.
+    """
+    global _weight_cache_bytes
+    if not power > 0:
+        raise ValueError("power must be positive")
+
+    key = (station_coords, tuple(bbox), rows, cols, float(power))
+    with _weight_cache_lock:
+        weights = _weight_cache.get(key)
+        if weights is not None:
+            _weight_cache.move_to_end(key)
+            return weights
+
+    weights = _build_idw_weights(station_coords, bbox, rows, cols, power)
+
+    if weights.nbytes <= WEIGHT_CACHE_BYTES:
+        with _weight_cache_lock:
+            if key not in _weight_cache:
+                _weight_cache[key] = weights
+                _weight_cache_bytes += weights.nbytes
+            while _weight_cache_bytes > WEIGHT_CACHE_BYTES:
+                _, evicted = _weight_cache.popitem(last=False)
+                _weight_cache_bytes -= evicted.nbytes
+    return weights
+
+
+def interpolate_grid(station_coords, values, bbox=BENGALURU_BBOX, rows=64, cols=64, power=2.0):
+    """
+    Interpolates station values onto a (rows, cols) float32 grid
+    """
+    weights = idw_weights(tuple(station_coords), bbox, rows, cols, power)
+    return (weights @ np.asarray(values, dtype=np.float32)).reshape(rows, cols)
+
+
+def aqi_grid(pm25_grid):
+    return calculate_aqi_pm25_array(pm25_grid).astype(np.float32)
+
+
+def aqi_to_rgba(aqi, alpha=160):
+    """
+    Colours an AQI grid with the dashboard's category palette
+    """
+    bounds = np.array([upper for upper, _ in AQI_COLORS])
+    palette = np.array([rgb for _, rgb in AQI_COLORS], dtype=np.uint8)
+
+    idx = np.clip(np.searchsorted(bounds, aqi, side="left"), 0, len(bounds) - 1)
+    rgba = np.empty(aqi.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = palette[idx]
+    rgba[..., 3] = alpha
+    return rgba
+
+
+def encode_png(rgba):
+    """
+    Minimal RGBA PNG encoder (no Pillow dependency)
+    """
+    height, width, _ = rgba.shape
+
+    # Each scanline is prefixed with filter type 0 (None)
+    raw = np.empty((height, 1 + width * 4), dtype=np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = rgba.reshape(height, -1)
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
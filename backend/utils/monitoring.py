@@ -0,0 +1,303 @@
+import bisect
+import logging
+import math
+import os
+import threading
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from utils.streaming_features import LAG_COLS
+from utils.validation import VALIDATED_COLS, flagged_columns
+
+logger = logging.getLogger("pm25.monitoring")
+
+# =========================
+# MONITOR CONFIG
+# =========================
+HORIZON = timedelta(hours=1)        # a prediction is judged against PM2.5 one hour later
+MATCH_TOLERANCE = timedelta(minutes=30)
+MAX_PENDING = 48                    # per station; older unmatched predictions are dropped
+EWMA_ALPHA = 0.05                   # ~20-reading memory for the "recent" error stats
+N_BINS = 10
+
+RMSE_ALERT = 25.0                   # µg/m³, on the EWMA RMSE
+PSI_ALERT = 0.2                     # population stability index, per feature
+MIN_MATCHED = 24                    # matched pairs before error alerts can fire
+MIN_DRIFT_SAMPLES = 100             # live rows before drift alerts can fire
+
+# Predictions whose target is further than this from the station's newest
+# reading can never be matched, so they are not kept
+MAX_LEAD = timedelta(hours=3)
+MAX_LAG = timedelta(hours=MAX_PENDING)
+
+# Timezone of the live log; tz-aware request datetimes are converted to it
+LIVE_TZ = os.getenv("LIVE_TZ", "Asia/Kolkata")
+
+# Drift is only tracked for inputs the live feed actually measures. Model
+# features it never has (Benzene, NO, SO2, ...) arrive as defaults, and
+# calendar features only ever cover the current few weeks, so their PSI
+# against the training year says nothing about the data.
+# NOx is validated but WAQI never reports it, so it is always imputed.
+DRIFT_FEATURES = [c for c in VALIDATED_COLS if c not in ("PM2.5", "NOx")] + LAG_COLS
+
+
+class ErrorStats:
+    """
+    Streaming error statistics in O(1) memory.
+
+    Welford's algorithm gives the all-time mean/variance of the signed error
+    (bias and spread); EWMAs of |e| and e² give recent MAE/RMSE.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.abs_sum = 0.0
+        self.sq_sum = 0.0
+        self.ewma_abs = None
+        self.ewma_sq = None
+
+    def update(self, error):
+        self.n += 1
+        delta = error - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (error - self.mean)
+
+        self.abs_sum += abs(error)
+        self.sq_sum += error ** 2
+
+        if self.ewma_abs is None:
+            self.ewma_abs, self.ewma_sq = abs(error), error ** 2
+        else:
+            self.ewma_abs += EWMA_ALPHA * (abs(error) - self.ewma_abs)
+            self.ewma_sq += EWMA_ALPHA * (error ** 2 - self.ewma_sq)
+
+    def summary(self):
+        if self.n == 0:
+            return {"n": 0}
+        return {
+            "n": self.n,
+            "bias": round(self.mean, 3),
+            "error_std": round(math.sqrt(self.m2 / self.n), 3),
+            "mae": round(self.abs_sum / self.n, 3),
+            "rmse": round(math.sqrt(self.sq_sum / self.n), 3),
+            "ewma_mae": round(self.ewma_abs, 3),
+            "ewma_rmse": round(math.sqrt(self.ewma_sq), 3),
+        }
+
+
+class StreamingHistogram:
+    """
+    Fixed-bin histogram of one feature, with bin edges taken from the
+    training distribution's quantiles. Compared with the training
+    proportions through the population stability index (PSI).
+    """
+
+    def __init__(self, train_values, n_bins=N_BINS):
+        train_values = np.asarray(train_values, dtype=float)
+        train_values = train_values[~np.isnan(train_values)]
+
+        # Interior edges only; the outer bins are open-ended
+        edges = np.unique(np.quantile(train_values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+        self.edges = edges
+        self.train_props = np.bincount(
+            np.searchsorted(edges, train_values, side="right"),
+            minlength=len(edges) + 1
+        ) / len(train_values)
+        self.counts = np.zeros(len(edges) + 1)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.counts += np.bincount(
+            np.searchsorted(self.edges, values, side="right"),
+            minlength=len(self.counts)
+        )
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def psi(self):
+        if self.n == 0:
+            return None
+        eps = 1e-4
+        live = np.clip(self.counts / self.n, eps, None)
+        train = np.clip(self.train_props, eps, None)
+        return float(np.sum((live - train) * np.log(live / train)))
+
+
+def to_local(ts):
+    """
+    Any timestamp → tz-naive, in the live log's timezone
+    """
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(LIVE_TZ).tz_localize(None)
+    return ts
+
+
+class PredictionMonitor:
+    """
+    Joins each prediction to the PM2.5 that arrives HORIZON later in the
+    live log, keeps per-station ErrorStats, and tracks feature drift of the
+    measured model inputs against the training data.
+    """
+
+    def __init__(self, training_features, stations, drift_features=DRIFT_FEATURES):
+        self._lock = threading.Lock()
+        self.stations = set(stations)  # only catalog stations are tracked
+        self.pending = {}            # station → sorted [(target_time, prediction)]
+        self.errors = {}             # station → ErrorStats
+        self.watermark = {}          # station → newest reading already observed
+        self.histograms = {
+            col: StreamingHistogram(training_features[col])
+            for col in drift_features
+            if col in training_features.columns
+        }
+        self._alerting = set()
+
+    def _accepts(self, station, target):
+        newest = self.watermark.get(station)
+        if newest is None:
+            newest = to_local(pd.Timestamp.now(tz=LIVE_TZ))
+        return newest - MAX_LAG <= target <= newest + MAX_LEAD
+
+    def record_predictions(self, stations, reading_times, predictions, inputs, qc_flags=None):
+        """
+        Registers predictions made from each station's reading at
+        reading_time. `inputs` are the raw input rows (dicts, before model
+        defaults are filled in); only the values they actually carry feed
+        the drift histograms, minus any imputed ones named in the rows'
+        `qc_flags`. Repeats for an already-recorded reading are ignored, so
+        polling /comparison does not skew them.
+        """
+        fresh = []
+        with self._lock:
+            for i, (station, ts, pred) in enumerate(zip(stations, reading_times, predictions)):
+                if not isinstance(station, str) or station not in self.stations:
+                    continue
+                try:
+                    target = to_local(ts) + HORIZON
+                except (TypeError, ValueError):
+                    continue
+                if not self._accepts(station, target):
+                    continue
+
+                queue = self.pending.setdefault(station, [])
+                pos = bisect.bisect_left(queue, (target,))
+                if pos < len(queue) and queue[pos][0] == target:
+                    continue
+                queue.insert(pos, (target, float(pred)))
+                if len(queue) > MAX_PENDING:
+                    del queue[0]
+                fresh.append(i)
+
+            if fresh:
+                rows = pd.DataFrame([inputs[i] for i in fresh])
+                imputed = [flagged_columns(qc_flags[i]) if qc_flags is not None else set() for i in fresh]
+                for col, hist in self.histograms.items():
+                    if col in rows.columns:
+                        values = pd.to_numeric(rows[col], errors="coerce")
+                        values = values.mask([col in cols for cols in imputed])
+                        hist.update(values.to_numpy())
+
+    def observe_readings(self, df):
+        """
+        Feeds realized PM2.5 from the live log. Only rows newer than the
+        per-station watermark are looked at.
+        """
+        if "PM2.5" not in df.columns or df.empty:
+            return
+
+        matched = False
+        with self._lock:
+            watermark = pd.to_datetime(df["station_id"].astype(object).map(self.watermark))
+            new = df[watermark.isna() | (df["datetime"] > watermark)]
+            if new.empty:
+                return
+
+            new = new.sort_values("datetime", kind="stable")
+            actuals = new["PM2.5"]
+            if "qc_flags" in new.columns:
+                # Imputed values are not real observations
+                imputed = new["qc_flags"].fillna("").str.contains("PM2.5:", regex=False)
+                actuals = actuals.mask(imputed)
+            for station, rows in new.groupby("station_id", observed=True, sort=False):
+                self.watermark[station] = rows["datetime"].iloc[-1]
+
+                queue = self.pending.get(station)
+                if not queue:
+                    continue
+                for ts, actual in zip(rows["datetime"], actuals.loc[rows.index]):
+                    matched |= self._match(station, queue, ts, actual)
+
+        if matched:
+            # Evaluates thresholds and logs any newly crossed ones
+            self.report()
+
+    def _match(self, station, queue, ts, actual):
+        if pd.isna(actual):
+            return False
+        ts = to_local(ts)
+
+        # queue is sorted by target: drop expired targets from the front,
+        # then settle the ones within tolerance of this reading
+        expired = bisect.bisect_left(queue, (ts - MATCH_TOLERANCE,))
+        due = bisect.bisect_right(queue, (ts + MATCH_TOLERANCE, math.inf))
+        for _, predicted in queue[expired:due]:
+            self.errors.setdefault(station, ErrorStats()).update(predicted - float(actual))
+        del queue[:due]
+        return due > expired
+
+    def report(self):
+        with self._lock:
+            stations = {
+                station: {
+                    **self.errors.get(station, ErrorStats()).summary(),
+                    "pending": len(self.pending.get(station, ())),
+                }
+                for station in set(self.pending) | set(self.errors)
+            }
+            drift = {
+                col: {"psi": None if hist.psi() is None else round(hist.psi(), 4), "n": hist.n}
+                for col, hist in self.histograms.items()
+            }
+
+        alerts = []
+        for station, stats in stations.items():
+            if stats["n"] >= MIN_MATCHED and stats["ewma_rmse"] > RMSE_ALERT:
+                alerts.append({
+                    "type": "accuracy",
+                    "station": station,
+                    "message": f"EWMA RMSE {stats['ewma_rmse']} exceeds {RMSE_ALERT}",
+                })
+        for col, d in drift.items():
+            if d["n"] >= MIN_DRIFT_SAMPLES and d["psi"] > PSI_ALERT:
+                alerts.append({
+                    "type": "drift",
+                    "feature": col,
+                    "message": f"PSI {d['psi']} exceeds {PSI_ALERT}",
+                })
+
+        with self._lock:
+            self._log_new_alerts(alerts)
+
+        return {
+            "horizon_hours": HORIZON.total_seconds() / 3600,
+            "thresholds": {"ewma_rmse": RMSE_ALERT, "psi": PSI_ALERT},
+            "stations": stations,
+            "drift": drift,
+            "alerts": alerts,
+        }
+
+    def _log_new_alerts(self, alerts):
+        active = {(a["type"], a.get("station") or a.get("feature")) for a in alerts}
+        for alert in alerts:
+            key = (alert["type"], alert.get("station") or alert.get("feature"))
+            if key not in self._alerting:
+                logger.warning("Monitoring alert [%s %s]: %s", *key, alert["message"])
+        self._alerting = active
@@ -0,0 +1,171 @@
+import itertools
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+
+# =========================
+# SCENARIO AXES
+# =========================
+# Percent-change axes scale one pollutant of the base reading
+PCT_AXES = {"pm10_pct": "PM10", "no2_pct": "NO2", "co_pct": "CO"}
+
+# Set axes overwrite a feature with each listed value
+SET_AXES = {
+    "is_festival": "is_festival",
+    "is_secondary_event": "is_secondary_event",
+    "is_local_event": "is_local_event",
+    "hour": "hour",
+}
+
+AXES = [*PCT_AXES, *SET_AXES]
+
+# Partial-dependence grids (what each curve is evaluated at)
+PD_GRIDS = {
+    "pm10_pct": list(range(-50, 51, 10)),
+    "no2_pct": list(range(-50, 51, 10)),
+    "co_pct": list(range(-50, 51, 10)),
+    "is_festival": [0, 1],
+    "is_secondary_event": [0, 1],
+    "is_local_event": [0, 1],
+    "hour": list(range(24)),
+}
+PD_SAMPLE = 200         # most recent training rows per station averaged over
+
+
+def parse_grids(spec):
+    """
+    {"no2_pct": [-20, 0], "hour": [8, 18], ...} → ordered {axis: values}.
+    Raises ValueError on a non-object spec, unknown axes, empty /
+    non-numeric / non-finite grids or out-of-range values.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("grids must be an object mapping axis → list of values")
+    unknown = set(spec) - set(AXES)
+    if unknown:
+        raise ValueError(f"Unknown scenario axes {sorted(unknown)}; expected some of {AXES}")
+
+    grids = {}
+    for axis in AXES:
+        if axis not in spec:
+            continue
+        values = spec[axis] if isinstance(spec[axis], list) else [spec[axis]]
+        if not values:
+            raise ValueError(f"Grid for {axis} is empty")
+        try:
+            values = [float(v) for v in values]
+        except (TypeError, ValueError):
+            raise ValueError(f"Grid for {axis} must be numeric")
+        if not all(math.isfinite(v) for v in values):
+            raise ValueError(f"Grid for {axis} must contain finite numbers")
+        if axis in PCT_AXES and any(v < -100 for v in values):
+            raise ValueError(f"{axis} values must be -100 or more (a concentration cannot go negative)")
+        if axis == "hour" and any(v != int(v) or not 0 <= v <= 23 for v in values):
+            raise ValueError("hour values must be integers 0-23")
+        if axis in SET_AXES and axis != "hour" and any(v not in (0, 1) for v in values):
+            raise ValueError(f"{axis} values must be 0 or 1")
+        grids[axis] = values
+    return grids
+
+
+def n_variants(grids):
+    return int(np.prod([len(v) for v in grids.values()])) if grids else 1
+
+
+def _apply(X, axis, values):
+    """
+    Applies one axis to X in place; `values` has one entry per row of X
+    """
+    if axis in PCT_AXES:
+        col = PCT_AXES[axis]
+        X[col] = X[col].to_numpy() * (1 + np.asarray(values) / 100.0)
+    else:
+        col = SET_AXES[axis]
+        X[col] = np.asarray(values).astype(X[col].dtype, copy=False)
+
+
+def expand_scenarios(base_X, grids):
+    """
+    One row of model features × the Cartesian product of the grids → a
+    feature matrix with one row per scenario, in itertools.product order
+    (last axis varies fastest).
+    """
+    combos = np.array(list(itertools.product(*grids.values())), dtype=float)
+    X = base_X.iloc[np.zeros(len(combos), dtype=int)].reset_index(drop=True)
+    for j, axis in enumerate(grids):
+        _apply(X, axis, combos[:, j])
+    return X
+
+
+def response_surface(predict, base_X, grids):
+    """
+    Evaluates every scenario with a single `predict` call and reshapes the
+    result onto the grid axes
+    """
+    X = expand_scenarios(base_X, grids)
+    pm25 = np.maximum(predict(X), 0.0)
+    shape = [len(v) for v in grids.values()]
+    return pm25.reshape(shape) if shape else pm25.reshape(())
+
+
+def partial_dependence(predict, X_station, pd_grids=PD_GRIDS):
+    """
+    For each axis, the mean prediction over X_station with that axis set to
+    each grid value and everything else left as observed. All curves of all
+    axes come from one stacked `predict` call.
+    """
+    n = len(X_station)
+    blocks, spans = [], []
+    for axis, values in pd_grids.items():
+        X = X_station.iloc[np.tile(np.arange(n), len(values))].reset_index(drop=True)
+        _apply(X, axis, np.repeat(values, n))
+        blocks.append(X)
+        spans.append((axis, values))
+
+    X_all = pd.concat(blocks, ignore_index=True)
+    preds = np.maximum(predict(X_all), 0.0)
+
+    curves, start = {}, 0
+    for axis, values in spans:
+        stop = start + n * len(values)
+        means = preds[start:stop].reshape(len(values), n).mean(axis=1)
+        curves[axis] = {
+            "values": values,
+            "pm25": [round(float(v), 2) for v in means],
+        }
+        start = stop
+    return curves
+
+
+class PartialDependenceCache:
+    """
+    Per-station partial-dependence curves, computed once from the station's
+    most recent training rows and kept for the life of the process
+    """
+
+    def __init__(self, predict, training_df, feature_columns, sample_size=PD_SAMPLE):
+        self.predict = predict
+        self.samples = {
+            station: rows[feature_columns].tail(sample_size).reset_index(drop=True)
+            for station, rows in training_df.sort_values("from_date", kind="stable")
+                                            .groupby("station_id", observed=True, sort=False)
+        }
+        self._curves = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stations(self):
+        return list(self.samples)
+
+    def get(self, station):
+        if station not in self.samples:
+            return None
+        with self._lock:
+            if station not in self._curves:
+                self._curves[station] = partial_dependence(self.predict, self.samples[station])
+            return self._curves[station]
+
+    def warm(self):
+        for station in self.samples:
+            self.get(station)
@@ -0,0 +1,207 @@
+import gzip
+import json
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+# Optional fast paths; plain json / gzip are always available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+
+# Compressing tiny bodies costs more than it saves
+MIN_COMPRESS_BYTES = 512
+
+
+def _to_builtin(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def dumps_json(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, default=_to_builtin, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_to_builtin, separators=(",", ":")).encode()
+
+
+def _dumps_arrow(obj):
+    # Arrow suits tabular payloads: a list of flat-ish records
+    if not (isinstance(obj, list) and obj and all(isinstance(r, dict) for r in obj)):
+        raise TypeError("Arrow encoding needs a list of records")
+    table = pa.Table.from_pylist(obj)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def parse_accept(header):
+    """
+    "br;q=0.5, gzip" → {"br": 0.5, "gzip": 1.0}; malformed q-values count as 0
+    """
+    weights = {}
+    for part in (header or "").lower().split(","):
+        token, *params = [p.strip() for p in part.split(";")]
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        weights[token] = max(q, weights.get(token, 0.0))
+    return weights
+
+
+def _best(candidates):
+    """
+    [(name, q), ...] in order of preference → the highest-q name with q > 0,
+    earlier entries winning ties; None if every q is 0
+    """
+    name, q = max(candidates, key=lambda c: c[1], default=(None, 0))
+    return name if q > 0 else None
+
+
+def negotiate_media_type(accept):
+    """
+    Picks the acceptable type with the highest q-value, breaking ties
+    towards the more compact one (Arrow, then msgpack, then JSON). Binary
+    formats must be named explicitly; wildcards only match JSON, which is
+    also the fallback.
+    """
+    weights = parse_accept(accept)
+    candidates = []
+    if pa is not None:
+        candidates.append((ARROW, weights.get(ARROW, 0)))
+    if msgpack is not None:
+        candidates.append((MSGPACK, max(weights.get(MSGPACK, 0), weights.get("application/x-msgpack", 0))))
+    candidates.append((JSON, weights.get(JSON, weights.get("application/*", weights.get("*/*", 0)))))
+    return _best(candidates) or JSON
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    The acceptable coding with the highest q-value, Brotli winning ties
+    with gzip (a "*" wildcard counts for both); None for identity
+    """
+    weights = parse_accept(accept_encoding)
+    wildcard = weights.get("*", 0)
+    candidates = []
+    if brotli is not None:
+        candidates.append(("br", weights.get("br", wildcard)))
+    candidates.append(("gzip", weights.get("gzip", wildcard)))
+    return _best(candidates)
+
+
+def serialize(obj, media_type):
+    """
+    Returns (body, media_type); payloads a format cannot express fall back to JSON
+    """
+    if media_type == ARROW:
+        try:
+            return _dumps_arrow(obj), ARROW
+        except TypeError:
+            pass
+    elif media_type == MSGPACK:
+        return msgpack.packb(obj, default=_to_builtin), MSGPACK
+    return dumps_json(obj), JSON
+
+
+def compress(body, encoding):
+    """
+    Returns (body, encoding actually applied)
+    """
+    if encoding is None or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if encoding == "br":
+        return brotli.compress(body, quality=5), "br"
+    return gzip.compress(body, compresslevel=6), "gzip"
+
+
+class Encoded(NamedTuple):
+    """
+    A response body ready to send as-is
+    """
+    body: bytes
+    media_type: str
+    headers: dict
+
+
+def encode(obj, accept, accept_encoding):
+    """
+    Serialises + compresses a payload for the given request headers
+    """
+    body, media_type = serialize(obj, negotiate_media_type(accept))
+    body, encoding = compress(body, negotiate_encoding(accept_encoding))
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Encoded(body, media_type, headers)
+
+
+class ResponseCache:
+    """
+    Pre-serialised response bodies, keyed by (endpoint key, media type,
+    encoding) and tagged with a data version (e.g. the live log's mtime).
+    A version change invalidates every representation of that key.
+    """
+
+    def __init__(self, max_keys=256):
+        self.max_keys = max_keys
+        self._entries = OrderedDict()      # key → (version, {(media type, encoding): Encoded})
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _variant(accept, accept_encoding):
+        return negotiate_media_type(accept), negotiate_encoding(accept_encoding)
+
+    def get(self, key, version, accept, accept_encoding):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1].get(self._variant(accept, accept_encoding))
+
+    def put(self, key, version, accept, accept_encoding, encoded):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                entry = (version, {})
+                self._entries[key] = entry
+            entry[1][self._variant(accept, accept_encoding)] = encoded
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
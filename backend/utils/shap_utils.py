@@ -7,10 +7,20 @@ class RFShapExplainer:
 
     def explain(self, X):
         shap_values = self.explainer.shap_values(X)
+        return self._reasons(X.columns, shap_values[0])
 
+    def explain_batch(self, X):
+        """
+        Explains every row of X with a single SHAP call
+        """
+        shap_values = self.explainer.shap_values(X)
+        return [self._reasons(X.columns, row) for row in shap_values]
+
+    @staticmethod
+    def _reasons(columns, shap_row):
         shap_df = pd.DataFrame({
-            "feature": X.columns,
-            "shap_value": shap_values[0]
+            "feature": columns,
+            "shap_value": shap_row
         }).sort_values(by="shap_value", ascending=False)
 
         reasons = []
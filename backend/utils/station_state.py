@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+
+class StationState:
+    """
+    Fixed-width state arrays with one row per station, grown as new
+    stations appear. Subclasses declare their fields as
+    name=(width, fill, dtype); width None gives a 1-D array.
+    """
+
+    def __init__(self, **fields):
+        self._fields = fields
+        self._index = {}
+        for name, (width, fill, dtype) in fields.items():
+            shape = (0,) if width is None else (0, width)
+            setattr(self, name, np.full(shape, fill, dtype=dtype))
+
+    def _rows_for(self, station_ids):
+        new = [s for s in dict.fromkeys(station_ids) if s not in self._index]
+        if new:
+            for s in new:
+                self._index[s] = len(self._index)
+            for name, (width, fill, dtype) in self._fields.items():
+                shape = (len(new),) if width is None else (len(new), width)
+                setattr(self, name, np.concatenate([getattr(self, name), np.full(shape, fill, dtype=dtype)]))
+        return np.array([self._index[s] for s in station_ids], dtype=int)
+
+
+def station_rounds(stations, order=None):
+    """
+    Yields index arrays where round r holds each station's r-th reading
+    (in `order`, default input order), so every round can be one vectorised
+    step across stations
+    """
+    stations = np.asarray(stations)
+    order = np.arange(len(stations)) if order is None else np.asarray(order)
+    rounds = pd.Series(stations[order]).groupby(stations[order], sort=False).cumcount().to_numpy()
+    by_round = order[np.argsort(rounds, kind="stable")]
+
+    start = 0
+    for stop in np.cumsum(np.bincount(rounds)):
+        yield by_round[start:stop]
+        start = stop
@@ -0,0 +1,97 @@
+import json
+import os
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+# Shared by data_updater/fetch.py, src/ and the backend
+CATALOG_PATH = Path(
+    os.getenv(
+        "STATION_CATALOG_PATH",
+        Path(__file__).resolve().parents[2] / "config" / "stations.json"
+    )
+)
+
+EARTH_RADIUS_KM = 6371.0088
+
+REQUIRED_FIELDS = ["id", "lat", "lon", "source", "data_folder", "poll_interval_minutes"]
+
+
+def _to_unit_xyz(lat, lon):
+    """
+    Lat/lon (degrees) → points on the unit sphere, so Euclidean nearest
+    neighbours in the KD-tree are also great-circle nearest neighbours
+    """
+    import numpy as np
+
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    return np.column_stack([
+        np.cos(lat) * np.cos(lon),
+        np.cos(lat) * np.sin(lon),
+        np.sin(lat),
+    ])
+
+
+class StationCatalog:
+    """
+    The station list from config/stations.json. Loading it only needs the
+    standard library; numpy/scipy are imported on the first nearest() call,
+    so fetch.py and the src/ scripts do not pay for the spatial index.
+    """
+
+    def __init__(self, stations):
+        for station in stations:
+            missing = [f for f in REQUIRED_FIELDS if f not in station]
+            if missing:
+                raise ValueError(f"Station {station.get('id')} is missing {missing}")
+
+        self.stations = stations
+        self.by_id = {s["id"]: s for s in stations}
+
+    @cached_property
+    def _tree(self):
+        from scipy.spatial import cKDTree
+
+        return cKDTree(_to_unit_xyz(
+            [s["lat"] for s in self.stations], [s["lon"] for s in self.stations]
+        ))
+
+    def __len__(self):
+        return len(self.stations)
+
+    def __iter__(self):
+        return iter(self.stations)
+
+    def __contains__(self, station_id):
+        return station_id in self.by_id
+
+    def ids(self):
+        return list(self.by_id)
+
+    def get(self, station_id):
+        return self.by_id.get(station_id)
+
+    def nearest(self, lat, lon, k=1):
+        """
+        Returns the k nearest stations to (lat, lon), closest first,
+        each with its great-circle distance in km
+        """
+        import numpy as np
+
+        k = max(1, min(k, len(self.stations)))
+        chord, idx = self._tree.query(_to_unit_xyz([lat], [lon])[0], k=k)
+        chord, idx = np.atleast_1d(chord), np.atleast_1d(idx)
+
+        # Chord length on the unit sphere → arc length
+        distance_km = 2 * np.arcsin(np.clip(chord / 2, 0, 1)) * EARTH_RADIUS_KM
+
+        return [
+            {**self.stations[i], "distance_km": round(float(d), 3)}
+            for i, d in zip(idx, distance_km)
+        ]
+
+
+@lru_cache(maxsize=None)
+def load_station_catalog(path=CATALOG_PATH):
+    with open(path, encoding="utf-8") as f:
+        return StationCatalog(json.load(f)["stations"])
@@ -0,0 +1,150 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.station_state import StationState, station_rounds
+
+# =========================
+# FEATURE CONFIG
+# =========================
+# Shared by src/03_feature_engineering.py and the backend, so training and
+# serving features are computed by the same code
+LAGS = (1, 6, 24)                   # hours
+LAG_COLS = [f"PM25_lag_{k}" for k in LAGS]
+
+WINTER_MONTHS = [11, 12, 1, 2]
+EARLY_MONTH_DAYS = 10
+
+TIME_COLS = ["hour", "day_of_week", "month", "is_weekend", "is_winter", "is_early_month"]
+
+NO_HOUR = np.iinfo(np.int64).min    # slot never written
+
+
+def time_features(timestamps):
+    """
+    Calendar features for each timestamp, as int8 columns (index kept when
+    `timestamps` is a Series)
+    """
+    ts = pd.DatetimeIndex(timestamps)
+    features = {
+        "hour": ts.hour,
+        "day_of_week": ts.weekday,
+        "month": ts.month,
+        "is_weekend": ts.weekday >= 5,
+        "is_winter": ts.month.isin(WINTER_MONTHS),
+        "is_early_month": ts.day <= EARLY_MONTH_DAYS,
+    }
+    return pd.DataFrame(
+        {col: np.asarray(values).astype("int8") for col, values in features.items()},
+        index=getattr(timestamps, "index", None)
+    )
+
+
+def to_hours(timestamps):
+    """
+    Timestamps → whole hours since the epoch (floored), as int64
+    """
+    return pd.DatetimeIndex(timestamps).to_numpy().astype("datetime64[h]").astype(np.int64)
+
+
+class StreamingFeatureEngine(StationState):
+    """
+    PM2.5 lag features computed one reading at a time.
+
+    Each station keeps a circular buffer of the last max(LAGS) hourly PM2.5
+    values together with the hour each slot was written for. lag_k of a
+    reading at hour h is the slot for h - k if it still holds that hour and
+    NaN otherwise, so missing hours come out exactly as the NaNs that the
+    offline pipeline's reindex + groupby().shift() produces, without ever
+    materialising the gap. State is O(max(LAGS)) per station.
+    """
+
+    def __init__(self, lags=LAGS):
+        self.lags = np.asarray(lags, dtype=np.int64)
+        self.size = int(self.lags.max())
+        self.columns = [f"PM25_lag_{k}" for k in lags]
+
+        super().__init__(
+            values=(self.size, np.nan, float),
+            hours=(self.size, NO_HOUR, np.int64),
+            last_hour=(None, NO_HOUR, np.int64),
+        )
+        self._lock = threading.Lock()
+
+    # =========================
+    # STATE
+    # =========================
+    def _step(self, rows, hours, pm25):
+        """
+        One reading per station: returns the lags, then stores the reading
+        """
+        back = hours[:, None] - self.lags
+        slots = back % self.size
+        held = self.hours[rows[:, None], slots] == back
+        lags = np.where(held, self.values[rows[:, None], slots], np.nan)
+
+        # Late readings never overwrite a newer hour in the same slot; a
+        # repeat of the same hour replaces it
+        slot = hours % self.size
+        newer = self.hours[rows, slot] <= hours
+        self.values[rows[newer], slot[newer]] = pm25[newer]
+        self.hours[rows[newer], slot[newer]] = hours[newer]
+        self.last_hour[rows] = np.maximum(self.last_hour[rows], hours)
+        return lags
+
+    # =========================
+    # UPDATES
+    # =========================
+    def transform(self, station_ids, timestamps, pm25):
+        """
+        Feeds readings (any stations, any order) and returns their lag
+        features as an (n, len(lags)) array in input order
+        """
+        stations = np.asarray(station_ids, dtype=object).astype(str)
+        hours = to_hours(timestamps)
+        values = np.asarray(pm25, dtype=float)
+        lags = np.full((len(stations), len(self.lags)), np.nan)
+
+        with self._lock:
+            for sel in station_rounds(stations, order=np.argsort(hours, kind="stable")):
+                lags[sel] = self._step(self._rows_for(stations[sel]), hours[sel], values[sel])
+        return lags
+
+    def observe(self, df, time_col="datetime", value_col="PM2.5"):
+        """
+        Feeds a (re-read) log: only rows from each station's latest hour on
+        are processed. Re-feeding that hour is idempotent.
+        """
+        df = df.dropna(subset=["station_id", time_col])
+        if df.empty:
+            return
+
+        stations = df["station_id"].astype(str)
+        with self._lock:
+            latest = {s: self.last_hour[row] for s, row in self._index.items()}
+        since = stations.map(latest)
+        new = (since.isna() | (to_hours(df[time_col]) >= since)).to_numpy()
+
+        if new.any():
+            rows = df[new]
+            self.transform(stations[new], rows[time_col], rows[value_col])
+
+    # =========================
+    # SERVING
+    # =========================
+    def next_lags(self, station):
+        """
+        Lag features of the hour after the station's latest reading (what
+        the offline pipeline would attach to that next row), NaN where the
+        hour is missing. None for an unknown station.
+        """
+        with self._lock:
+            row = self._index.get(str(station))
+            if row is None:
+                return None
+            back = self.last_hour[row] + 1 - self.lags
+            slots = back % self.size
+            held = self.hours[row, slots] == back
+            lags = np.where(held, self.values[row, slots], np.nan)
+        return dict(zip(self.columns, lags.tolist()))
@@ -0,0 +1,212 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.station_state import StationState, station_rounds
+
+# =========================
+# QC CONFIG
+# =========================
+# Pollutants written by data_updater/fetch.py
+VALIDATED_COLS = ["PM2.5", "PM10", "NO2", "NOx", "CO", "Ozone", "RH"]
+
+# Physically plausible ranges (WAQI reports sub-index values, so these are loose)
+RANGE_LIMITS = {
+    "PM2.5": (0, 999),
+    "PM10": (0, 999),
+    "NO2": (0, 500),
+    "NOx": (0, 1000),
+    "CO": (0, 100),
+    "Ozone": (0, 500),
+    "RH": (0, 100),
+}
+
+# Smallest hour-to-hour jump that can ever count as a spike
+MIN_SPIKE_DELTA = {
+    "PM2.5": 20.0,
+    "PM10": 40.0,
+    "NO2": 15.0,
+    "NOx": 20.0,
+    "CO": 2.0,
+    "Ozone": 20.0,
+    "RH": 15.0,
+}
+
+# Used when a station has never reported a value: the training medians
+# (ml_ready_dataset_clean.csv), so imputed inputs stay in-distribution
+DEFAULT_VALUES = {
+    "PM2.5": 18.75,
+    "PM10": 82.45,
+    "NO2": 17.03,
+    "NOx": 22.36,
+    "CO": 0.66,
+    "Ozone": 22.1,
+    "RH": 77.42,
+}
+
+SPIKE_Z = 5.0          # jump > SPIKE_Z × typical jump size
+STUCK_RUN = 6          # identical consecutive readings → stuck sensor
+# WAQI reports integer sub-indices, which legitimately repeat for hours on
+# quiet nights; whole-number readings need a much longer run to count
+STUCK_RUN_INTEGER = 24
+MIN_HISTORY = 6        # good readings needed before spike detection starts
+EWMA_ALPHA = 0.1       # weight of the newest jump in the running jump size
+
+QC_MISSING, QC_RANGE, QC_SPIKE, QC_STUCK = 1, 2, 3, 4
+QC_REASONS = np.array(["", "missing", "range", "spike", "stuck"])
+
+STATE_FIELDS = ["last_good", "last_raw", "run", "n", "msd"]
+
+
+class ReadingValidator(StationState):
+    """
+    Range, rate-of-change and stuck-sensor checks for live readings.
+
+    Keeps O(1) state per (station, pollutant) – last good value, last raw
+    value, length of the current identical run, count of good readings and
+    an EWMA of the squared hour-to-hour change – so each new batch is
+    checked with a handful of array operations across all stations at once.
+    Bad or missing values are replaced by the station's last good value
+    (or the training median if it has none) and recorded in a `qc_flags`
+    column.
+    """
+
+    def __init__(self, columns=VALIDATED_COLS):
+        self.columns = list(columns)
+        self._lo = np.array([RANGE_LIMITS[c][0] for c in self.columns], dtype=float)
+        self._hi = np.array([RANGE_LIMITS[c][1] for c in self.columns], dtype=float)
+        self._min_delta = np.array([MIN_SPIKE_DELTA[c] for c in self.columns], dtype=float)
+        self._default = np.array([DEFAULT_VALUES[c] for c in self.columns], dtype=float)
+
+        width = len(self.columns)
+        super().__init__(
+            last_good=(width, np.nan, float),
+            last_raw=(width, np.nan, float),
+            run=(width, 0.0, float),
+            n=(width, 0.0, float),
+            msd=(width, 0.0, float),
+        )
+
+    # =========================
+    # STATE
+    # =========================
+    def save(self, path):
+        stations = {
+            station: {
+                field: [None if np.isnan(v) else float(v) for v in getattr(self, field)[row]]
+                for field in STATE_FIELDS
+            }
+            for station, row in self._index.items()
+        }
+        Path(path).write_text(json.dumps({"columns": self.columns, "stations": stations}))
+
+    @classmethod
+    def load(cls, path):
+        saved = json.loads(Path(path).read_text())
+        validator = cls(saved["columns"])
+        rows = validator._rows_for(list(saved["stations"]))
+        for row, state in zip(rows, saved["stations"].values()):
+            for field in STATE_FIELDS:
+                getattr(validator, field)[row] = [np.nan if v is None else v for v in state[field]]
+        return validator
+
+    # =========================
+    # VALIDATION
+    # =========================
+    def _step(self, station_ids, x):
+        """
+        One reading per station: returns (cleaned values, QC codes)
+        """
+        rows = self._rows_for(station_ids)
+        last_good, last_raw = self.last_good[rows], self.last_raw[rows]
+        run, n, msd = self.run[rows], self.n[rows], self.msd[rows]
+
+        missing = np.isnan(x)
+        present = ~missing
+        out_of_range = present & ((x < self._lo) | (x > self._hi))
+        in_range = present & ~out_of_range
+
+        jump = x - last_good
+        limit = np.maximum(SPIKE_Z * np.sqrt(msd), self._min_delta)
+        has_history = (n >= MIN_HISTORY) & ~np.isnan(last_good)
+        spike = in_range & has_history & (np.abs(jump) > limit)
+
+        run = np.where(present, np.where(x == last_raw, run + 1, 1), run)
+        stuck_run = np.where(x == np.round(x), STUCK_RUN_INTEGER, STUCK_RUN)
+        stuck = in_range & (run >= stuck_run)
+
+        codes = np.select(
+            [missing, out_of_range, spike, stuck],
+            [QC_MISSING, QC_RANGE, QC_SPIKE, QC_STUCK],
+            0
+        ).astype(np.int8)
+        good = codes == 0
+
+        # Running jump size learns from every in-range reading, clipped so a
+        # genuine level shift is adopted gradually rather than rejected forever
+        learn = in_range & ~np.isnan(last_good)
+        clipped = np.clip(np.nan_to_num(jump), -limit, limit)
+        msd = np.where(learn, (1 - EWMA_ALPHA) * msd + EWMA_ALPHA * clipped ** 2, msd)
+
+        self.last_good[rows] = np.where(good, x, last_good)
+        self.last_raw[rows] = np.where(present, x, last_raw)
+        self.run[rows] = run
+        self.n[rows] = n + good
+        self.msd[rows] = msd
+
+        fallback = np.where(np.isnan(last_good), self._default, last_good)
+        return np.where(good, x, fallback), codes
+
+    def validate(self, df, provided=None):
+        """
+        Validates and imputes a batch of readings (any number of stations,
+        any number of readings per station, in time order per station).
+        Returns a copy with cleaned values and a `qc_flags` column.
+
+        `provided` maps station_id → the columns its source reports. Other
+        columns are still imputed (the model needs them) but never flagged,
+        since their absence is by design, not a fault.
+        """
+        df = df.sort_values("datetime", kind="stable").copy()
+        for col in self.columns:
+            if col not in df.columns:
+                df[col] = np.nan
+
+        values = df[self.columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        stations = df["station_id"].astype(str).to_numpy()
+        cleaned = np.empty_like(values)
+        codes = np.zeros(values.shape, dtype=np.int8)
+
+        for sel in station_rounds(stations):
+            cleaned[sel], codes[sel] = self._step(stations[sel], values[sel])
+
+        if provided is not None:
+            expected = np.array([
+                [col in provided.get(station, self.columns) for col in self.columns]
+                for station in stations
+            ], dtype=bool).reshape(codes.shape)
+            codes = np.where(expected, codes, 0)
+
+        df[self.columns] = cleaned
+        df["qc_flags"] = format_flags(codes, self.columns)
+        return df
+
+
+def format_flags(codes, columns):
+    """
+    QC code matrix → "PM10:spike;RH:missing" strings, "" when clean
+    """
+    labels = np.char.add(np.char.add(np.array(columns, dtype=str), ":"), QC_REASONS[codes])
+    labels = np.where(codes > 0, labels, "")
+    return [";".join(filter(None, row)) for row in labels]
+
+
+def flagged_columns(flags):
+    """
+    "PM10:spike;RH:missing" → {"PM10", "RH"}; empty / NaN → set()
+    """
+    if not isinstance(flags, str) or not flags:
+        return set()
+    return {flag.split(":", 1)[0] for flag in flags.split(";")}
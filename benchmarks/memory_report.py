@@ -0,0 +1,66 @@
+"""
+Memory-footprint report: default pandas dtypes vs the compact schema in
+backend/utils/dtypes.py.
+
+Usage (from the repo root):
+    python benchmarks/memory_report.py
+    python benchmarks/memory_report.py --csv data/ml_ready_dataset_new.csv
+    python benchmarks/memory_report.py --stations 50 --years 5
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+import synthetic
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+from utils.dtypes import read_csv, memory_mb
+
+DEFAULT_CSV = REPO_ROOT / "data" / "ml_ready_dataset_clean.csv"
+
+
+def report(path):
+    # The committed CSVs were re-saved with dd-mm-yyyy dates
+    before = pd.read_csv(path, parse_dates=["from_date"], dayfirst=True)
+    after = read_csv(path, parse_dates=["from_date"], dayfirst=True)
+
+    b_cols = before.memory_usage(deep=True)
+    a_cols = after.memory_usage(deep=True)
+
+    print(f"\n📄 {path}  ({len(before):,} rows × {before.shape[1]} cols)")
+    print(f"{'column':<22} {'before':>10} {'after':>10} {'dtype':>16}")
+    for col in before.columns:
+        print(
+            f"{col:<22} {b_cols[col] / 1024:>8.0f}KB {a_cols[col] / 1024:>8.0f}KB "
+            f"{str(after[col].dtype):>16}"
+        )
+
+    mb_before, mb_after = memory_mb(before), memory_mb(after)
+    print(f"{'TOTAL':<22} {mb_before:>8.2f}MB {mb_after:>8.2f}MB")
+    print(f"📉 {mb_before / mb_after:.1f}× smaller")
+    return mb_before, mb_after
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DataFrame memory footprint, before vs after dtype schema")
+    parser.add_argument("--csv", type=Path, default=None, help=f"CSV to measure (default: {DEFAULT_CSV.name})")
+    parser.add_argument("--stations", type=int, default=None, help="Measure a synthetic ML-ready dataset instead")
+    parser.add_argument("--years", type=float, default=1)
+    args = parser.parse_args()
+
+    if args.stations:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"synthetic_{args.stations}st_{args.years}y.csv"
+            synthetic.generate_ml_ready(args.stations, args.years).to_csv(path, index=False)
+            report(path)
+    else:
+        report(args.csv or DEFAULT_CSV)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Payload-size report: bytes on the wire and encode CPU for /comparison and
+/grid responses, per media type × content encoding, as the station count
+grows. Uses the same encoder as the backend (utils/serialization.py);
+formats whose optional package is not installed are skipped.
+
+Usage (from the repo root):
+    python benchmarks/payload_report.py
+    python benchmarks/payload_report.py --stations 3 50 500 --grid 128
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+import synthetic
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+from utils import serialization
+from utils.serialization import JSON, MSGPACK, ARROW, serialize, compress
+
+FORMATS = [
+    (JSON, True),
+    (MSGPACK, serialization.msgpack is not None),
+    (ARROW, serialization.pa is not None),
+]
+ENCODINGS = [
+    (None, True),
+    ("gzip", True),
+    ("br", serialization.brotli is not None),
+]
+
+
+def comparison_payload(n_stations, seed=42):
+    """
+    Same record shape as /comparison?intervals=true
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for station in synthetic.station_ids(n_stations):
+        pm25 = round(float(rng.gamma(4, 12)), 2)
+        rows.append({
+            "name": station.replace("_", " "),
+            "lat": round(float(rng.uniform(12.8, 13.2)), 5),
+            "lon": round(float(rng.uniform(77.4, 77.8)), 5),
+            "PM10": round(float(rng.gamma(5, 18)), 2),
+            "PM25": pm25,
+            "NO2": round(float(rng.gamma(3, 6)), 2),
+            "CO": round(float(rng.gamma(2, 0.3)), 2),
+            "AQI": int(min(500, pm25 * 1.6)),
+            "PM25_interval": {"p10": round(pm25 * 0.8, 2), "p50": pm25, "p90": round(pm25 * 1.25, 2)},
+        })
+    return rows
+
+
+def grid_payload(side, seed=42):
+    """
+    Same shape as /grid?format=json: float32 nowcast, rounded in float64
+    """
+    values = np.random.default_rng(seed).gamma(4, 12, size=(side, side)).astype(np.float32)
+    values = values.astype(np.float64).round(2)
+    return {"variable": "pm25", "rows": side, "cols": side, "values": values.tolist()}
+
+
+def measure(payload, media_type, encoding, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body, actual = serialize(payload, media_type)
+        body, applied = compress(body, encoding)
+    ms = (time.perf_counter() - start) / repeat * 1000
+    return len(body), ms, actual, applied
+
+
+def report(label, payload, repeat):
+    print(f"\n📦 {label}")
+    print(f"{'format':<38} {'encoding':>8} {'bytes':>10} {'encode':>10}")
+    raw_json = None
+    for media_type, available in FORMATS:
+        if not available:
+            continue
+        for encoding, enc_available in ENCODINGS:
+            if not enc_available:
+                continue
+            size, ms, actual, applied = measure(payload, media_type, encoding, repeat)
+            if actual != media_type:
+                # e.g. Arrow only encodes tabular payloads
+                break
+            raw_json = raw_json or size
+            print(
+                f"{media_type:<38} {applied or '-':>8} {size:>10,} {ms:>8.2f}ms"
+                f"  ({raw_json / size:.1f}× vs JSON)"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response size / encode cost per format and encoding")
+    parser.add_argument("--stations", type=int, nargs="+", default=[3, 50, 500])
+    parser.add_argument("--grid", type=int, nargs="+", default=[64, 256], help="Grid side lengths")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    missing = [name for name, mod in [("orjson", serialization.orjson), ("msgpack", serialization.msgpack),
+                                      ("brotli", serialization.brotli), ("pyarrow", serialization.pa)]
+               if mod is None]
+    if missing:
+        print("⚠️ Not installed, skipped:", ", ".join(missing))
+
+    for n in args.stations:
+        report(f"/comparison  ({n} stations)", comparison_payload(n), args.repeat)
+    for side in args.grid:
+        report(f"/grid?format=json  ({side}×{side})", grid_payload(side), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Performance benchmark runner for the prediction stack.
+
+Times the pieces that sit on the request path (feature preparation, the
+ensemble predict, SHAP), the API endpoints end-to-end through an in-process
+test client, and the src/ pipeline stages, all on synthetic data of a
+configurable scale. Results are written as JSON and optionally compared
+against a stored baseline.
+
+Usage (from the repo root):
+    python benchmarks/run.py --stations 3 --years 1
+    python benchmarks/run.py --save-baseline
+    python benchmarks/run.py --baseline benchmarks/baseline.json --threshold 0.25
+
+Exit code is 1 when any benchmark is slower than baseline × (1 + threshold).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import runpy
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import synthetic
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+BACKEND_DIR = REPO_ROOT / "backend"
+SRC_DIR = REPO_ROOT / "src"
+RESULTS_DIR = BENCH_DIR / "results"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+PIPELINE_STAGES = ["03_feature_engineering.py", "handle_missing.py"]
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def measure(fn, repeat=5, warmup=1):
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "mean_ms": round(statistics.mean(timings), 3),
+        "repeat": repeat,
+    }
+
+
+# =========================
+# SRC PIPELINE STAGES
+# =========================
+def bench_pipeline(n_stations, n_years, seed, repeat):
+    """
+    Runs the src/ scripts unchanged inside a scratch directory laid out like
+    the repo root (they read and write data/*.csv relative to the cwd).
+    """
+    results = {}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        data_dir = Path(workdir) / "data"
+        data_dir.mkdir()
+        synthetic.generate_final_dataset(n_stations, n_years, seed).to_csv(
+            data_dir / "final_dataset.csv", index=False
+        )
+
+        with working_dir(workdir):
+            for stage in PIPELINE_STAGES:
+                script = str(SRC_DIR / stage)
+
+                def run_stage():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        runpy.run_path(script, run_name="__main__")
+
+                # Each stage needs its predecessor's output, so no warmup
+                results[f"pipeline.{Path(stage).stem}"] = measure(run_stage, repeat, warmup=0)
+
+    return results
+
+
+# =========================
+# BACKEND COMPONENTS
+# =========================
+def load_backend(live_csv):
+    """
+    Imports backend/app.py the way uvicorn does (cwd = backend/) with the
+    live data path pointed at the synthetic log.
+    """
+    os.environ["LIVE_DATA_PATH"] = str(live_csv)
+    # The startup partial-dependence warm-up would compete with the timings
+    os.environ["PD_WARMUP"] = "0"
+    sys.path.insert(0, str(BACKEND_DIR))
+    with working_dir(BACKEND_DIR):
+        import app as backend_app
+    return backend_app
+
+
+def sample_payloads(ml_ready, n):
+    rows = ml_ready.sample(n, random_state=0, replace=len(ml_ready) < n)
+    payloads = rows.drop(columns=["station_id", "PM2.5"]).rename(
+        columns={"from_date": "datetime"}
+    )
+    payloads["datetime"] = payloads["datetime"].astype(str)
+    return payloads.to_dict(orient="records")
+
+
+def bench_components(backend_app, ml_ready, batch_size, repeat):
+    from utils.feature_engineering import prepare_features
+
+    cols = backend_app.feature_columns
+    single = sample_payloads(ml_ready, 1)[0]
+    batch = sample_payloads(ml_ready, batch_size)
+
+    X_single = prepare_features(single, cols)
+    X_batch = prepare_features(batch, cols)
+
+    def ensemble(X):
+        return (
+            backend_app.w_rf * backend_app.rf_model.predict(X)
+            + backend_app.w_xgb * backend_app.xgb_model.predict(X)
+        )
+
+    results = {
+        "prepare_features.single": measure(lambda: prepare_features(single, cols), repeat),
+        f"prepare_features.batch_{batch_size}": measure(lambda: prepare_features(batch, cols), repeat),
+        "ensemble_predict.single": measure(lambda: ensemble(X_single), repeat),
+        f"ensemble_predict.batch_{batch_size}": measure(lambda: ensemble(X_batch), repeat),
+        "shap_explain.single": measure(lambda: backend_app.shap_explainer.explain(X_single), repeat),
+    }
+    if backend_app.interval_estimator is not None:
+        point = ensemble(X_batch)
+        results[f"intervals.batch_{batch_size}"] = measure(
+            lambda: backend_app.interval_estimator.predict(X_batch, point), repeat
+        )
+    return results
+
+
+def bench_endpoints(backend_app, ml_ready, repeat):
+    from fastapi.testclient import TestClient
+
+    payload = sample_payloads(ml_ready, 1)[0]
+    station = synthetic.station_ids(1)[0]
+
+    def call(method, url, **kwargs):
+        res = client.request(method, url, **kwargs)
+        res.raise_for_status()
+
+    def call_cold(method, url, **kwargs):
+        # Drops the per-live-log-version caches so the full computation is timed
+        backend_app.response_cache.clear()
+        backend_app._comparison_cache.clear()
+        call(method, url, **kwargs)
+
+    with TestClient(backend_app.app) as client:
+        return {
+            "endpoint.latest": measure(lambda: call("GET", f"/latest?station_id={station}"), repeat),
+            "endpoint.comparison": measure(lambda: call("GET", "/comparison"), repeat),
+            "endpoint.comparison_cold": measure(lambda: call_cold("GET", "/comparison"), repeat),
+            "endpoint.predict": measure(lambda: call("POST", "/predict", json=payload), repeat),
+            "endpoint.predict_intervals": measure(
+                lambda: call("POST", "/predict?intervals=true", json=payload), repeat
+            ),
+        }
+
+
+# =========================
+# BASELINE COMPARISON
+# =========================
+def compare(current, baseline, threshold):
+    """
+    Returns (name, baseline_ms, current_ms, ratio) for every benchmark whose
+    median got slower than the allowed threshold.
+    """
+    regressions = []
+    for name, stats in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if not base or not base["median_ms"]:
+            continue
+        ratio = stats["median_ms"] / base["median_ms"]
+        if ratio > 1 + threshold:
+            regressions.append((name, base["median_ms"], stats["median_ms"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PM2.5 stack benchmarks")
+    parser.add_argument("--stations", type=int, default=3)
+    parser.add_argument("--years", type=float, default=1)
+    parser.add_argument("--live-readings", type=int, default=720, help="Hourly readings per station in the live log")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="Results JSON (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare against this results file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Also write results to {DEFAULT_BASELINE.name}")
+    parser.add_argument("--skip-pipeline", action="store_true")
+    parser.add_argument("--skip-backend", action="store_true")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "scale": {
+                "stations": args.stations,
+                "years": args.years,
+                "live_readings": args.live_readings,
+                "batch_size": args.batch_size,
+            },
+            "seed": args.seed,
+        },
+        "benchmarks": {},
+    }
+
+    if not args.skip_pipeline:
+        print("⏱️  src/ pipeline stages...")
+        results["benchmarks"].update(
+            bench_pipeline(args.stations, args.years, args.seed, args.repeat)
+        )
+
+    if not args.skip_backend:
+        with tempfile.TemporaryDirectory() as tmp:
+            live_csv = Path(tmp) / "live_data.csv"
+            synthetic.generate_live_data(args.stations, args.live_readings, args.seed).to_csv(
+                live_csv, index=False
+            )
+            ml_ready = synthetic.generate_ml_ready(args.stations, args.years, args.seed)
+
+            print("⏱️  backend components...")
+            backend_app = load_backend(live_csv)
+            with working_dir(BACKEND_DIR):
+                results["benchmarks"].update(
+                    bench_components(backend_app, ml_ready, args.batch_size, args.repeat)
+                )
+
+                print("⏱️  API endpoints...")
+                results["benchmarks"].update(bench_endpoints(backend_app, ml_ready, args.repeat))
+
+    print(f"\n{'benchmark':<40} {'median ms':>12} {'min ms':>12}")
+    for name, stats in results["benchmarks"].items():
+        print(f"{name:<40} {stats['median_ms']:>12.3f} {stats['min_ms']:>12.3f}")
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"\n📁 Results saved to {output}")
+
+    if args.save_baseline:
+        DEFAULT_BASELINE.write_text(json.dumps(results, indent=2))
+        print(f"📌 Baseline updated: {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline["meta"].get("scale") != results["meta"]["scale"]:
+            print("⚠️ Baseline was recorded at a different scale, comparison may be misleading")
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for name, base_ms, cur_ms, ratio in regressions:
+                print(f"   {name}: {base_ms:.3f} → {cur_ms:.3f} ms ({ratio:.2f}×)")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Synthetic station data for benchmarks.
+
+Generates hourly readings for `n_stations` × `n_years` with the same columns
+and rough value ranges as the real CPCB exports, in the three shapes the
+stack consumes:
+    - final_dataset.csv     (input of src/03_feature_engineering.py)
+    - ml_ready frame        (model features + PM2.5, as in ml_ready_dataset_clean.csv)
+    - live_data.csv         (what data_updater/fetch.py writes)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+# (mean, std) per pollutant, loosely matched to ml_ready_dataset_clean.csv
+POLLUTANT_PROFILE = {
+    "Ozone": (24.0, 15.0),
+    "Benzene": (1.0, 0.8),
+    "Toluene": (1.9, 1.5),
+    "RH": (65.0, 15.0),
+    "PM10": (92.0, 40.0),
+    "NO": (5.3, 5.0),
+    "NO2": (18.9, 10.0),
+    "NOx": (21.9, 12.0),
+    "NH3": (13.5, 6.0),
+    "SO2": (6.3, 3.0),
+    "CO": (0.68, 0.4),
+}
+
+EVENT_COLS = ["is_festival", "is_secondary_event", "is_local_event"]
+
+
+def station_ids(n_stations):
+    return [f"STN_{i:03d}" for i in range(n_stations)]
+
+
+def generate_final_dataset(n_stations=3, n_years=1, seed=42, start="2025-01-01"):
+    """
+    Hourly raw readings + event flags, one block per station
+    """
+    rng = np.random.default_rng(seed)
+    timeline = pd.date_range(start=start, periods=int(n_years * 365 * 24), freq="h")
+    n = len(timeline)
+
+    # Event flags are per day and shared by every station
+    days = timeline.normalize()
+    unique_days = days.unique()
+    event_days = {
+        col: pd.Index(unique_days[rng.random(len(unique_days)) < p])
+        for col, p in zip(EVENT_COLS, [0.01, 0.004, 0.007])
+    }
+
+    frames = []
+    hour = timeline.hour.to_numpy()
+    diurnal = 1 + 0.3 * np.sin((hour - 8) / 24 * 2 * np.pi)
+
+    for station in station_ids(n_stations):
+        df = pd.DataFrame({"from_date": timeline, "station_id": station})
+        for col, (mean, std) in POLLUTANT_PROFILE.items():
+            df[col] = np.clip(rng.normal(mean, std, n) * diurnal, 0, None).round(2)
+
+        # PM2.5 is an AR(1) process around a PM10-driven level
+        level = 0.24 * df["PM10"].to_numpy()
+        drive = 0.2 * level + rng.normal(0, 5, n)
+        pm25 = lfilter([1.0], [1.0, -0.8], drive)
+        df["PM2.5"] = np.clip(pm25, 0, None).round(2)
+
+        # Knock out ~2% of readings so gap handling is exercised
+        gaps = rng.random(n) < 0.02
+        df.loc[gaps, ["PM2.5", "PM10", "NO2"]] = np.nan
+
+        df["month"] = df["from_date"].dt.month
+        for col in EVENT_COLS:
+            df[col] = days.isin(event_days[col]).astype(int)
+
+        frames.append(df)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def generate_ml_ready(n_stations=3, n_years=1, seed=42):
+    """
+    Fully featurised frame (no NaNs) like ml_ready_dataset_clean.csv
+    """
+    df = generate_final_dataset(n_stations, n_years, seed)
+    df = df.sort_values(["station_id", "from_date"]).reset_index(drop=True)
+
+    df["hour"] = df["from_date"].dt.hour
+    df["day_of_week"] = df["from_date"].dt.weekday
+    df["is_weekend"] = (df["day_of_week"] >= 5).astype(int)
+    df["is_winter"] = df["month"].isin([11, 12, 1, 2]).astype(int)
+    df["is_early_month"] = (df["from_date"].dt.day <= 10).astype(int)
+
+    for lag in [1, 6, 24]:
+        df[f"PM25_lag_{lag}"] = df.groupby("station_id")["PM2.5"].shift(lag)
+
+    return df.dropna().reset_index(drop=True)
+
+
+def generate_live_data(n_stations=3, n_readings=720, seed=42, end="2026-01-09 14:00"):
+    """
+    Append-only live log as written by data_updater/fetch.py
+    """
+    rng = np.random.default_rng(seed)
+    timeline = pd.date_range(end=end, periods=n_readings, freq="h")
+
+    frames = []
+    for station in station_ids(n_stations):
+        df = pd.DataFrame({"datetime": timeline, "station_id": station})
+        for col in ["PM10", "NO2", "NOx", "CO", "Ozone", "RH"]:
+            mean, std = POLLUTANT_PROFILE[col]
+            df[col] = np.clip(rng.normal(mean, std, n_readings), 0, None).round(2)
+        df["PM2.5"] = np.clip(rng.normal(40, 15, n_readings), 0, None).round(1)
+        frames.append(df)
+
+    df = pd.concat(frames, ignore_index=True).sort_values("datetime")
+    return df[["datetime", "PM10", "NO2", "NOx", "CO", "Ozone", "RH", "station_id", "PM2.5"]]
@@ -1,10 +1,16 @@
 import os
+import sys
 import requests
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.stations import load_station_catalog
+from utils.validation import ReadingValidator
+
 # =========================
 # LOAD ENVIRONMENT VARIABLES
 # =========================
@@ -18,21 +24,27 @@ TOKEN = os.getenv("AQICN_TOKEN")
 # =========================
 # TARGET LOCATIONS
 # =========================
-LOCATIONS = {
-    "RVCE_Mailsandra": (12.9338, 77.5263),
-    "Peenya": (13.0205, 77.5360),
-    "Silkboard": (12.9279, 77.6240),
-}
+# Defined once in config/stations.json
+CATALOG = load_station_catalog()
+
+# Upper bound on concurrent WAQI requests
+MAX_WORKERS = int(os.getenv("FETCH_WORKERS", 8))
+
+# Cron jitter: a station polled a few seconds short of its interval is still due
+POLL_GRACE = timedelta(minutes=2)
 
 # =========================
 # OUTPUT CSV
 # =========================
 OUTPUT_PATH = Path("../frontend/data/live_data.csv")
 
+# Per-station QC state (last good value, run length, jump size) between runs
+QC_STATE_PATH = OUTPUT_PATH.with_suffix(".qc_state.json")
 
-def fetch_aqi(lat, lon):
+
+def fetch_aqi(lat, lon, session=requests):
     url = f"https://api.waqi.info/feed/geo:{lat};{lon}/?token={TOKEN}"
-    res = requests.get(url)
+    res = session.get(url, timeout=15)
 
     if res.status_code != 200:
         return None
@@ -50,44 +62,131 @@ def fetch_aqi(lat, lon):
         "NO2": iaqi.get("no2", {}).get("v"),
         "CO": iaqi.get("co", {}).get("v"),
         "Ozone": iaqi.get("o3", {}).get("v"),
-        "RH": iaqi.get("h", {}).get("v", 60)  # fallback
+        "RH": iaqi.get("h", {}).get("v")
     }
 
 
+SOURCES = {
+    "waqi": fetch_aqi,
+}
+
+# Pollutants each source reports; anything else (e.g. NOx for WAQI) is
+# absent by design and imputed without a QC flag
+SOURCE_FIELDS = {
+    "waqi": ["PM2.5", "PM10", "NO2", "CO", "Ozone", "RH"],
+}
+
+
+def provided_fields():
+    """
+    station_id → columns its source reports
+    """
+    return {
+        station["id"]: SOURCE_FIELDS.get(station["source"], [])
+        for station in CATALOG
+    }
+
+
+def due_stations(df_old, now):
+    """
+    Stations whose last reading is older than their polling interval
+    """
+    last_seen = {}
+    if df_old is not None and not df_old.empty:
+        last_seen = (
+            pd.to_datetime(df_old["datetime"])
+              .groupby(df_old["station_id"])
+              .max()
+              .to_dict()
+        )
+
+    due = []
+    for station in CATALOG:
+        last = last_seen.get(station["id"])
+        interval = timedelta(minutes=station["poll_interval_minutes"])
+        if last is None or now - last >= interval - POLL_GRACE:
+            due.append(station)
+    return due
+
+
+def fetch_station(station, session):
+    fetcher = SOURCES.get(station["source"])
+    if fetcher is None:
+        print(f"⚠️ Unknown data source '{station['source']}' for {station['id']}")
+        return None
+    return fetcher(station["lat"], station["lon"], session)
+
+
+def load_validator(df_old):
+    """
+    Restores QC state, or builds it by replaying the existing log. A log
+    written before validation existed is cleaned in the same pass.
+    """
+    if QC_STATE_PATH.exists():
+        return ReadingValidator.load(QC_STATE_PATH), df_old
+
+    validator = ReadingValidator()
+    if df_old is not None and not df_old.empty:
+        print("🧹 Building QC state from existing live_data.csv")
+        df_old = validator.validate(df_old, provided=provided_fields())
+        df_old.to_csv(OUTPUT_PATH, index=False)
+        validator.save(QC_STATE_PATH)
+    return validator, df_old
+
+
 # =========================
 # MAIN EXECUTION
 # =========================
 if __name__ == "__main__":
+    df_old = pd.read_csv(OUTPUT_PATH) if OUTPUT_PATH.exists() else None
+    validator, df_old = load_validator(df_old)
+
+    now = datetime.now()
+    stations = due_stations(df_old, now)
+    if not stations:
+        print("⏭️ No stations due for polling")
+        exit()
+
+    # Station requests are independent, so fetch them concurrently
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        fetched = list(pool.map(lambda st: fetch_station(st, session), stations))
+
     rows = []
 
-    for station, (lat, lon) in LOCATIONS.items():
-        aqi_info = fetch_aqi(lat, lon)
+    for station, aqi_info in zip(stations, fetched):
+        station_id = station["id"]
 
         if not aqi_info:
-            print(f"❌ Failed to fetch data for {station}")
+            print(f"❌ Failed to fetch data for {station_id}")
             continue
 
         row = {
-            "datetime": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "station_id": station,
+            "datetime": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "station_id": station_id,
             **aqi_info
         }
 
         rows.append(row)
 
-        print(f"✅ {station} updated → PM2.5 = {row['PM2.5']}")
+        print(f"✅ {station_id} updated → PM2.5 = {row['PM2.5']}")
 
     if not rows:
         print("⚠️ No data fetched")
         exit()
 
-    df_new = pd.DataFrame(rows)
+    # Range / spike / stuck checks and imputation happen once, here, so
+    # readers can use the values as-is
+    df_new = validator.validate(pd.DataFrame(rows), provided=provided_fields())
+
+    flagged = df_new[df_new["qc_flags"] != ""]
+    for _, row in flagged.iterrows():
+        print(f"🚩 {row['station_id']}: {row['qc_flags']}")
 
-    if OUTPUT_PATH.exists():
-        df_old = pd.read_csv(OUTPUT_PATH)
+    if df_old is not None:
         df_final = pd.concat([df_old, df_new], ignore_index=True)
     else:
         df_final = df_new
 
     df_final.to_csv(OUTPUT_PATH, index=False)
+    validator.save(QC_STATE_PATH)
     print("📁 live_data.csv updated successfully")
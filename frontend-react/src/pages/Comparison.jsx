@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts'
-import { STATIONS, getAQIColor, getAQICategory, getComparisonData } from '../services/api'
+import { getAQIColor, getAQICategory, getComparisonData } from '../services/api'
 import Card from '../components/ui/Card'
 import AQIGauge from '../components/AQIGauge'
 
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react'
-import { predictPM25, getMockPrediction, getLatestData, STATIONS } from '../services/api'
+import { predictPM25, getMockPrediction, getLatestData, getStations } from '../services/api'
 import Card from '../components/ui/Card'
 import Button from '../components/ui/Button'
 import PollutantCard from '../components/PollutantCard'
@@ -9,6 +9,7 @@ import HealthAdvisory from '../components/HealthAdvisory'
 import HistoricalChart from '../components/HistoricalChart'
 
 const Dashboard = ({ darkMode }) => {
+    const [stations, setStations] = useState(['Peenya'])
     const [selectedStation, setSelectedStation] = useState('Peenya')
     const [loading, setLoading] = useState(false)
     const [prediction, setPrediction] = useState(null)
@@ -18,10 +19,19 @@ const Dashboard = ({ darkMode }) => {
     // Initial state with safe defaults
     const [sensorData, setSensorData] = useState({
         PM10: 0, NO2: 0, NO: 0, NOx: 0, CO: 0, Ozone: 0, RH: 0,
-        PM25_lag_1: 0, PM25_lag_24: 0,
+        PM25_lag_1: 0, PM25_lag_6: 0, PM25_lag_24: 0,
         datetime: '--'
     })
 
+    // Load the station catalog once
+    useEffect(() => {
+        getStations().then((result) => {
+            if (result.success && result.data.length > 0) {
+                setStations(result.data.map((station) => station.id))
+            }
+        })
+    }, [])
+
     // Fetch live data on mount and station change
     useEffect(() => {
         fetchData(selectedStation)
@@ -49,7 +59,9 @@ const Dashboard = ({ darkMode }) => {
 
         try {
             const payload = {
-                datetime: sensorData.datetime !== '--' ? sensorData.datetime : new Date().toISOString(),
+                // Lets the backend check this prediction against the station's next reading
+                station_id: selectedStation,
+                datetime: sensorData.forecast_datetime || (sensorData.datetime !== '--' ? sensorData.datetime : new Date().toISOString()),
                 PM10: sensorData.PM10,
                 NO2: sensorData.NO2,
                 NO: sensorData.NO || 0,
@@ -58,6 +70,7 @@ const Dashboard = ({ darkMode }) => {
                 Ozone: sensorData.Ozone,
                 RH: sensorData.RH,
                 PM25_lag_1: sensorData.PM25_lag_1,
+                PM25_lag_6: sensorData.PM25_lag_6,
                 PM25_lag_24: sensorData.PM25_lag_24,
             }
 
@@ -103,7 +116,7 @@ const Dashboard = ({ darkMode }) => {
                             📍 Select Monitoring Station
                         </label>
                         <div className="flex flex-wrap gap-2">
-                            {Object.keys(STATIONS).map((station) => (
+                            {stations.map((station) => (
                                 <button
                                     key={station}
                                     onClick={() => handleStationChange(station)}
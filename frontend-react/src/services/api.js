@@ -49,6 +49,20 @@ export const getComparisonData = async () => {
     }
 }
 
+// Station catalog (config/stations.json), served by the backend
+export const getStations = async () => {
+    try {
+        const response = await api.get('/stations')
+        return { success: true, data: response.data }
+    } catch (error) {
+        console.error('Fetch Stations Error:', error)
+        return {
+            success: false,
+            error: error.response?.data?.detail || error.message || 'Failed to fetch stations'
+        }
+    }
+}
+
 // Mock data for demo/testing when backend is not available
 export const getMockPrediction = () => ({
     pm25_prediction: 42.5,
@@ -63,12 +77,6 @@ export const getMockPrediction = () => ({
     ]
 })
 
-// Station coordinates for Bengaluru
-export const STATIONS = {
-    'Peenya': { lat: 13.0205, lon: 77.5360, id: 'peenya' },
-    'RVCE_Mailsandra': { lat: 12.9338, lon: 77.5263, id: 'rvce' },
-    'Silkboard': { lat: 12.9279, lon: 77.6240, id: 'silkboard' },
-}
 
 // AQI category colors and info
 export const AQI_CATEGORIES = {
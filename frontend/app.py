@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import requests
-import math
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -11,19 +10,8 @@ import plotly.graph_objects as go
 BACKEND_URL = "http://127.0.0.1:8000/predict"
 DATA_PATH = "data/live_data.csv"
 
-# =============================
-# SAFE VALUE HANDLER (CRITICAL)
-# =============================
-def safe_value(x):
-    if x is None:
-        return 0.0
-    try:
-        x = float(x)
-        if math.isnan(x) or math.isinf(x):
-            return 0.0
-        return x
-    except:
-        return 0.0
+# Readings are validated and imputed at write time (data_updater/fetch.py)
+READING_COLS = ["PM2.5", "PM10", "NO2", "NOx", "CO", "Ozone", "RH"]
 
 # =============================
 # PAGE CONFIG
@@ -53,6 +41,11 @@ st.markdown("""
 @st.cache_data(ttl=60)
 def load_data():
     df = pd.read_csv(DATA_PATH, parse_dates=["datetime"])
+    # Only a log written before ingest validation existed can hold NaNs
+    if "qc_flags" not in df.columns:
+        cols = df.columns.intersection(READING_COLS)
+        df[cols] = df[cols].fillna(0.0)
+    df["qc_flags"] = df.get("qc_flags", pd.Series("", index=df.index)).fillna("")
     return df.sort_values("datetime")
 
 df = load_data()
@@ -86,34 +79,34 @@ with st.sidebar:
 st.markdown("## 📡 Latest CPCB Reading")
 
 c1, c2, c3, c4 = st.columns(4)
-c1.metric("PM10", f"{safe_value(latest.get('PM10')):.1f} µg/m³")
-c2.metric("NO2", f"{safe_value(latest.get('NO2')):.1f} ppb")
-c3.metric("CO", f"{safe_value(latest.get('CO')):.2f} mg/m³")
-c4.metric("Ozone", f"{safe_value(latest.get('Ozone')):.1f} ppb")
+c1.metric("PM10", f"{latest['PM10']:.1f} µg/m³")
+c2.metric("NO2", f"{latest['NO2']:.1f} ppb")
+c3.metric("CO", f"{latest['CO']:.2f} mg/m³")
+c4.metric("Ozone", f"{latest['Ozone']:.1f} ppb")
 
 c5, c6, c7, c8 = st.columns(4)
-c5.metric("NOx", f"{safe_value(latest.get('NOx')):.1f} ppb")
-c6.metric("Humidity", f"{safe_value(latest.get('RH')):.0f}%")
+c5.metric("NOx", f"{latest['NOx']:.1f} ppb")
+c6.metric("Humidity", f"{latest['RH']:.0f}%")
 c7.metric("Time", latest["datetime"].strftime("%H:%M"))
 c8.metric("Date", latest["datetime"].strftime("%d %b %Y"))
 
-if pd.isna(latest.get("NOx")):
-    st.warning("⚠ NOx sensor missing — fallback value used")
+if latest["qc_flags"]:
+    st.warning(f"⚠ Imputed readings: {latest['qc_flags']}")
 
 # =============================
-# PREDICTION PAYLOAD (SAFE)
+# PREDICTION PAYLOAD
 # =============================
 payload = {
     "datetime": str(latest["datetime"]),
-    "PM10": safe_value(latest.get("PM10")),
-    "NO2": safe_value(latest.get("NO2")),
-    "NO": safe_value(latest.get("NO")),
-    "NOx": safe_value(latest.get("NOx")),
-    "CO": safe_value(latest.get("CO")),
-    "Ozone": safe_value(latest.get("Ozone")),
-    "RH": safe_value(latest.get("RH")),
-    "PM25_lag_1": safe_value(latest.get("PM25_lag_1")),
-    "PM25_lag_24": safe_value(latest.get("PM25_lag_24")),
+    "PM10": float(latest["PM10"]),
+    "NO2": float(latest["NO2"]),
+    "NO": float(latest.get("NO", 0.0)),
+    "NOx": float(latest["NOx"]),
+    "CO": float(latest["CO"]),
+    "Ozone": float(latest["Ozone"]),
+    "RH": float(latest["RH"]),
+    "PM25_lag_1": float(latest.get("PM25_lag_1", 0.0)),
+    "PM25_lag_24": float(latest.get("PM25_lag_24", 0.0)),
 }
 
 # =============================
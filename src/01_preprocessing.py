@@ -1,5 +1,12 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.stations import load_station_catalog
+from utils.dtypes import apply_schema
+
 INPUT_FILE = r"C:\5th sem\main el\data\combined_air_quality_2025.xlsx"
 OUTPUT_FILE = r"C:\5th sem\main el\data\processed_data.csv"
 
@@ -24,9 +31,11 @@ df = df.rename(columns={
     "To Date": "to_date"
 })
 
-# 7. FIX: Rename station column if wrongly named (e.g., "Peenya")
-if "Peenya" in df.columns:
-    df = df.rename(columns={"Peenya": "station_id"})
+# 7. FIX: Rename station column if wrongly named after a station (e.g., "Peenya")
+if "station_id" not in df.columns:
+    misnamed = [c for c in df.columns if c in load_station_catalog()]
+    if misnamed:
+        df = df.rename(columns={misnamed[0]: "station_id"})
 
 # (Safety) If station_id still doesn't exist, raise alert
 if "station_id" not in df.columns:
@@ -43,6 +52,9 @@ df = df.dropna(subset=["from_date"])
 df["month"] = df["from_date"].dt.month
 df["month_name"] = df["from_date"].dt.month_name()
 
+# 10b. Compact dtypes (float32 readings, int8 calendar fields, categorical ids)
+df = apply_schema(df)
+
 # 11. Sort month-wise and time-wise
 df = df.sort_values(by=["month", "from_date"]).reset_index(drop=True)
 
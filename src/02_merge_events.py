@@ -1,13 +1,19 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.dtypes import read_csv
+
 # =========================
 # LOAD DATA
 # =========================
 
 # Load cleaned air quality data
-df = pd.read_csv(
+df = read_csv(
     "data/processed_data.csv",
-    parse_dates=["from_date"]
+    parse_dates=["from_date", "to_date"]
 )
 
 # Load events calendar
@@ -51,7 +57,7 @@ df = df.merge(
 
 # Fill missing event flags with 0
 event_cols = ["is_festival", "is_secondary_event", "is_local_event"]
-df[event_cols] = df[event_cols].fillna(0).astype(int)
+df[event_cols] = df[event_cols].fillna(0).astype("int8")
 
 # Drop helper column
 df = df.drop(columns=["date"])
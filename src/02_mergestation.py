@@ -1,15 +1,18 @@
 import pandas as pd
 import os
+import sys
 import glob
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.stations import load_station_catalog
+from utils.dtypes import apply_schema
 
 # Base data directory
 BASE_DIR = r"C:\5th sem\main el\data"
 
-stations = {
-    "Peenya": "Peenya",
-    "RVCE_Mailsandra": "RVCE_Mailsandra",
-    "Silkboard": "Silkboard"
-}
+# station_id → folder, from config/stations.json
+stations = {s["id"]: s["data_folder"] for s in load_station_catalog()}
 
 all_data = []
 
@@ -25,7 +28,7 @@ for station_id, folder_name in stations.items():
         # Add station_id column
         df["station_id"] = station_id
         
-        all_data.append(df)
+        all_data.append(apply_schema(df))
 
 # Combine ALL stations + ALL months (row-wise)
 combined_df = pd.concat(all_data, ignore_index=True, sort=True)
@@ -1,9 +1,16 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.dtypes import read_csv, apply_schema
+from utils.streaming_features import StreamingFeatureEngine, TIME_COLS, time_features
+
 # =========================
 # LOAD DATA
 # =========================
-df = pd.read_csv(
+df = read_csv(
     "data/final_dataset.csv",
     parse_dates=["from_date"]
 )
@@ -12,8 +19,8 @@ df = pd.read_csv(
 # AGGREGATE TO HOURLY
 # (already hourly, but kept for safety)
 # =========================
-df = (
-    df.groupby(["station_id", "from_date"], as_index=False)
+df = apply_schema(
+    df.groupby(["station_id", "from_date"], as_index=False, observed=True)
       .mean(numeric_only=True)
 )
 
@@ -22,7 +29,7 @@ df = (
 # =========================
 full_dfs = []
 
-for station, g in df.groupby("station_id"):
+for station, g in df.groupby("station_id", observed=True):
     g = g.sort_values("from_date")
 
     full_index = pd.date_range(
@@ -41,7 +48,7 @@ for station, g in df.groupby("station_id"):
     g["station_id"] = station
     full_dfs.append(g)
 
-df = pd.concat(full_dfs, ignore_index=True)
+df = apply_schema(pd.concat(full_dfs, ignore_index=True))
 
 # =========================
 # FIX TEMPERATURE COLUMN (if duplicated)
@@ -53,13 +60,8 @@ if "Temp.1" in df.columns and "Temp" in df.columns:
 # =========================
 # TIME FEATURES
 # =========================
-df["hour"] = df["from_date"].dt.hour
-df["day_of_week"] = df["from_date"].dt.weekday
-df["month"] = df["from_date"].dt.month
-df["is_weekend"] = (df["day_of_week"] >= 5).astype(int)
-
-df["is_winter"] = df["month"].isin([11, 12, 1, 2]).astype(int)
-df["is_early_month"] = (df["from_date"].dt.day <= 10).astype(int)
+# Shared with the backend (backend/utils/streaming_features.py)
+df[TIME_COLS] = time_features(df["from_date"])
 
 # =========================
 # SORT
@@ -69,9 +71,10 @@ df = df.sort_values(["station_id", "from_date"])
 # =========================
 # LAG FEATURES (SAFE NOW)
 # =========================
-df["PM25_lag_1"] = df.groupby("station_id")["PM2.5"].shift(1)
-df["PM25_lag_6"] = df.groupby("station_id")["PM2.5"].shift(6)
-df["PM25_lag_24"] = df.groupby("station_id")["PM2.5"].shift(24)
+# Same streaming engine the backend uses for live readings; on the full
+# hourly timeline this equals groupby("station_id")["PM2.5"].shift(k)
+lag_engine = StreamingFeatureEngine()
+df[lag_engine.columns] = lag_engine.transform(df["station_id"], df["from_date"], df["PM2.5"])
 
 # =========================
 # DROP ONLY IF TARGET IS MISSING
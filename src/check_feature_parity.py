@@ -0,0 +1,69 @@
+"""
+Training/serving feature parity check.
+
+Replays ml_ready_dataset_new.csv (output of 03_feature_engineering.py)
+through the backend's StreamingFeatureEngine hour by hour, the way live
+readings arrive, and compares its lag and calendar features with the ones
+stored in the file. Hours dropped for a missing target are simply absent
+from the replay, so the engine has to recover the offline NaN lags through
+its own gap detection.
+
+Run from the repo root, after 03_feature_engineering.py:
+    python src/check_feature_parity.py
+
+03 writes ISO timestamps, so the file is read without dayfirst; pass
+--dayfirst for a copy that was re-saved with dd-mm-yyyy dates.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.dtypes import read_csv
+from utils.streaming_features import StreamingFeatureEngine, TIME_COLS, time_features
+
+# =========================
+# LOAD DATA
+# =========================
+parser = argparse.ArgumentParser(description="Streaming vs offline feature parity")
+parser.add_argument("--csv", default="data/ml_ready_dataset_new.csv")
+parser.add_argument("--dayfirst", action="store_true", help="Dates were re-saved as dd-mm-yyyy")
+args = parser.parse_args()
+
+df = read_csv(args.csv, parse_dates=["from_date"], dayfirst=args.dayfirst)
+df = df.sort_values(["from_date", "station_id"], kind="stable").reset_index(drop=True)
+
+# =========================
+# REPLAY, ONE HOUR AT A TIME
+# =========================
+engine = StreamingFeatureEngine()
+streamed = np.full((len(df), len(engine.columns)), np.nan)
+
+for _, rows in df.groupby("from_date", sort=True):
+    streamed[rows.index] = engine.transform(rows["station_id"], rows["from_date"], rows["PM2.5"])
+
+# =========================
+# COMPARE
+# =========================
+failures = 0
+
+for j, col in enumerate(engine.columns):
+    offline = df[col].to_numpy(dtype=float)
+    same = np.isclose(streamed[:, j], offline, rtol=0, atol=1e-9) | (
+        np.isnan(streamed[:, j]) & np.isnan(offline)
+    )
+    print(f"{'✅' if same.all() else '❌'} {col}: {(~same).sum()} mismatches / {len(df)} rows")
+    if not same.all():
+        failures += 1
+        print(df.loc[~same, ["from_date", "station_id", col]].assign(streamed=streamed[~same, j]).head())
+
+calendar = time_features(df["from_date"])
+for col in TIME_COLS:
+    mismatches = int((calendar[col].to_numpy() != df[col].to_numpy()).sum())
+    print(f"{'✅' if mismatches == 0 else '❌'} {col}: {mismatches} mismatches")
+    failures += mismatches > 0
+
+sys.exit(1 if failures else 0)
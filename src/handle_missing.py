@@ -1,9 +1,13 @@
-import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from utils.dtypes import read_csv
 
 # =========================
 # LOAD DATA
 # =========================
-df = pd.read_csv(
+df = read_csv(
     "data/ml_ready_dataset_new.csv",
     parse_dates=["from_date"]
 )
@@ -23,7 +27,7 @@ print("Dropped sparse columns:", drop_cols)
 # DROP COLUMNS MISSING FOR ANY STATION
 # =========================
 station_missing = (
-    df.groupby("station_id", group_keys=False)
+    df.groupby("station_id", group_keys=False, observed=True)
       .apply(lambda x: x.isna().all())
 )
 
@@ -49,7 +53,7 @@ lag_cols = [c for c in lag_cols if c in df.columns]
 
 for col in lag_cols:
     df[col] = (
-        df.groupby("station_id")[col]
+        df.groupby("station_id", observed=True)[col]
           .transform(lambda x: x.ffill().bfill())
     )
 
@@ -61,7 +65,7 @@ weather_cols = ["Temp", "RH", "SR"]
 for col in weather_cols:
     if col in df.columns:
         df[col] = (
-            df.groupby("station_id")[col]
+            df.groupby("station_id", observed=True)[col]
               .transform(lambda x: x.interpolate().ffill().bfill())
         )
 
@@ -77,7 +81,7 @@ pollutant_cols = [
 for col in pollutant_cols:
     if col in df.columns:
         df[col] = (
-            df.groupby("station_id")[col]
+            df.groupby("station_id", observed=True)[col]
               .transform(lambda x: x.fillna(x.median()))
         )
 
@@ -88,7 +92,7 @@ event_cols = ["is_festival", "is_secondary_event", "is_local_event"]
 
 for col in event_cols:
     if col in df.columns:
-        df[col] = df[col].fillna(0).astype(int)
+        df[col] = df[col].fillna(0).astype("int8")
 
 # =========================
 # FINAL STEP: DROP UNAVOIDABLE NaN ROWS (LAG EDGES)